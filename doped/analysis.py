@@ -39,10 +39,9 @@ from doped.utils.parsing import (
     check_atom_mapping_far_from_defect,
     get_defect_site_idxs_and_unrelaxed_structure,
     get_defect_type_and_composition_diff,
-    get_locpot,
+    get_locpot_planar_averages,
     get_neutral_nelect_from_vasprun,
     get_orientational_degeneracy,
-    get_outcar,
     get_vasprun,
 )
 from doped.utils.plotting import format_defect_name
@@ -244,6 +243,20 @@ def defect_from_structures(
 
     check_atom_mapping_far_from_defect(bulk_supercell, defect_supercell, defect_site_in_bulk.frac_coords)
 
+    for_monty_defect = {  # initialise doped Defect object, needs to use defect site in bulk (which for
+        # substitutions differs from defect_site)
+        "@module": "doped.core",
+        "@class": def_type.capitalize(),
+        "structure": bulk_supercell,
+        "site": defect_site_in_bulk,
+    }  # note that we now define the Defect in the bulk supercell, rather than the primitive structure
+    # as done during generation. Future work could try mapping the relaxed defect site back to the
+    # primitive cell, however interstitials will be very tricky for this...
+    defect = MontyDecoder().process_decoded(for_monty_defect)
+
+    if not return_all_info:  # guessed initial structure (and bulk Voronoi nodes) only needed for all info
+        return defect
+
     if unrelaxed_defect_structure:
         if def_type == "interstitial":
             # get closest Voronoi site in bulk supercell to final interstitial site as this is likely
@@ -274,10 +287,11 @@ def defect_from_structures(
                     "Voronoi nodes": voronoi_frac_coords,
                 }
 
-            closest_node_frac_coords = min(
-                voronoi_frac_coords,
-                key=lambda node: defect_site.distance_and_image_from_frac_coords(node)[0],
-            )
+            # minimum-image distances to all nodes at once, rather than looping over each node:
+            node_distances = defect_site.lattice.get_all_distances(
+                defect_site.frac_coords, np.asarray(voronoi_frac_coords, dtype=float).reshape(-1, 3)
+            )[0]
+            closest_node_frac_coords = voronoi_frac_coords[int(np.argmin(node_distances))]
             guessed_initial_defect_structure = unrelaxed_defect_structure.copy()
             int_site = guessed_initial_defect_structure[defect_site_idx]
             guessed_initial_defect_structure.remove_sites([defect_site_idx])
@@ -298,20 +312,6 @@ def defect_from_structures(
             "`initial_defect_structure` is indeed unrelaxed."
         )
 
-    for_monty_defect = {  # initialise doped Defect object, needs to use defect site in bulk (which for
-        # substitutions differs from defect_site)
-        "@module": "doped.core",
-        "@class": def_type.capitalize(),
-        "structure": bulk_supercell,
-        "site": defect_site_in_bulk,
-    }  # note that we now define the Defect in the bulk supercell, rather than the primitive structure
-    # as done during generation. Future work could try mapping the relaxed defect site back to the
-    # primitive cell, however interstitials will be very tricky for this...
-    defect = MontyDecoder().process_decoded(for_monty_defect)
-
-    if not return_all_info:
-        return defect
-
     return (
         defect,
         defect_site,
@@ -485,7 +485,10 @@ def defect_entry_from_paths(
         **kwargs:
             Keyword arguments to pass to ``DefectParser()`` methods
             (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
-            such as ``bulk_locpot_dict``, ``bulk_site_potentials`` etc.
+            such as ``bulk_locpot_dict``, ``bulk_site_potentials`` etc, or
+            ``vasprun_kwargs`` (dict of keyword arguments to pass to ``pymatgen``'s
+            ``Vasprun`` when parsing the ``vasprun.xml`` files, e.g.
+            ``{"parse_dos": False}`` for faster parsing).
 
     Return:
         Parsed ``DefectEntry`` object.
@@ -1325,12 +1328,12 @@ def _get_bulk_locpot_dict(bulk_path, quiet=False):
             bulk_locpot_path,
             dir_type="bulk",
         )
-    bulk_locpot = get_locpot(bulk_locpot_path)
-    return {str(k): bulk_locpot.get_average_along_axis(k) for k in [0, 1, 2]}
+    bulk_locpot_averages = get_locpot_planar_averages(bulk_locpot_path)
+    return {str(k): bulk_locpot_averages[k] for k in [0, 1, 2]}
 
 
 def _get_bulk_site_potentials(bulk_path, quiet=False):
-    from doped.corrections import _raise_incomplete_outcar_error  # avoid circular import
+    from doped.corrections import _get_site_potentials  # avoid circular import
 
     bulk_outcar_path, multiple = _get_output_files_and_check_if_multiple("OUTCAR", bulk_path)
     if multiple and not quiet:
@@ -1340,12 +1343,7 @@ def _get_bulk_site_potentials(bulk_path, quiet=False):
             bulk_outcar_path,
             dir_type="bulk",
         )
-    bulk_outcar = get_outcar(bulk_outcar_path)
-
-    if bulk_outcar.electrostatic_potential is None:
-        _raise_incomplete_outcar_error(bulk_outcar_path, dir_type="bulk")
-
-    return -1 * np.array(bulk_outcar.electrostatic_potential)
+    return _get_site_potentials(bulk_outcar_path, dir_type="bulk")
 
 
 class DefectParser:
@@ -1385,7 +1383,10 @@ class DefectParser:
                 (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
                 such as ``bulk_locpot_dict``, ``bulk_site_potentials`` etc. Mainly
                 used by DefectsParser to expedite parsing by avoiding reloading
-                bulk data for each defect.
+                bulk data for each defect. Can also include ``vasprun_kwargs``, a
+                dict of keyword arguments to pass to ``pymatgen``'s ``Vasprun`` when
+                parsing the ``vasprun.xml`` files (e.g. ``{"parse_dos": False}`` to
+                skip parsing the DOS, which is not used here, for faster parsing).
         """
         self.defect_entry: DefectEntry = defect_entry
         self.defect_vr = defect_vr
@@ -1455,7 +1456,10 @@ class DefectParser:
                 (``load_FNV_data()``, ``load_eFNV_data()``, ``load_bulk_gap_data()``)
                 such as ``bulk_locpot_dict``, ``bulk_site_potentials`` etc. Mainly
                 used by DefectsParser to expedite parsing by avoiding reloading
-                bulk data for each defect.
+                bulk data for each defect. Can also include ``vasprun_kwargs``, a
+                dict of keyword arguments to pass to ``pymatgen``'s ``Vasprun`` when
+                parsing the ``vasprun.xml`` files (e.g. ``{"parse_dos": False}`` to
+                skip parsing the DOS, which is not used here, for faster parsing).
 
         Return:
             ``DefectParser`` object.
@@ -1476,7 +1480,8 @@ class DefectParser:
                 bulk_vr_path,
                 dir_type="bulk",
             )
-        bulk_vr = get_vasprun(bulk_vr_path)
+        vasprun_kwargs = kwargs.get("vasprun_kwargs", {})
+        bulk_vr = get_vasprun(bulk_vr_path, **vasprun_kwargs)
         bulk_supercell = bulk_vr.final_structure.copy()
 
         # add defect simple properties
@@ -1491,7 +1496,7 @@ class DefectParser:
                 defect_vr_path,
                 dir_type="defect",
             )
-        defect_vr = get_vasprun(defect_vr_path)
+        defect_vr = get_vasprun(defect_vr_path, **vasprun_kwargs)
 
         possible_defect_name = os.path.basename(
             defect_path.rstrip("/.").rstrip("/")  # remove any trailing slashes to ensure correct name
@@ -1910,8 +1915,8 @@ class DefectParser:
                 defect_locpot_path,
                 dir_type="defect",
             )
-        defect_locpot = get_locpot(defect_locpot_path)
-        defect_locpot_dict = {str(k): defect_locpot.get_average_along_axis(k) for k in [0, 1, 2]}
+        defect_locpot_averages = get_locpot_planar_averages(defect_locpot_path)
+        defect_locpot_dict = {str(k): defect_locpot_averages[k] for k in [0, 1, 2]}
 
         self.defect_entry.calculation_metadata.update(
             {
@@ -1948,7 +1953,7 @@ class DefectParser:
         Returns:
             bulk_site_potentials for reuse in parsing other defect entries
         """
-        from doped.corrections import _raise_incomplete_outcar_error  # avoid circular import
+        from doped.corrections import _get_site_potentials  # avoid circular import
 
         if not self.defect_entry.charge_state:
             # don't need to load outcars if charge is zero
@@ -1970,12 +1975,7 @@ class DefectParser:
                 defect_outcar_path,
                 dir_type="defect",
             )
-        defect_outcar = get_outcar(defect_outcar_path)
-
-        if defect_outcar.electrostatic_potential is None:
-            _raise_incomplete_outcar_error(defect_outcar_path, dir_type="defect")
-
-        defect_site_potentials = -1 * np.array(defect_outcar.electrostatic_potential)
+        defect_site_potentials = _get_site_potentials(defect_outcar_path, dir_type="defect")
 
         self.defect_entry.calculation_metadata.update(
             {
@@ -2003,7 +2003,7 @@ class DefectParser:
                     bulk_vr_path,
                     dir_type="bulk",
                 )
-            self.bulk_vr = get_vasprun(bulk_vr_path)
+            self.bulk_vr = get_vasprun(bulk_vr_path, **self.kwargs.get("vasprun_kwargs", {}))
 
         if not self.defect_vr:
             defect_vr_path, multiple = _get_output_files_and_check_if_multiple(
@@ -2016,7 +2016,7 @@ class DefectParser:
                     defect_vr_path,
                     dir_type="defect",
                 )
-            self.defect_vr = get_vasprun(defect_vr_path)
+            self.defect_vr = get_vasprun(defect_vr_path, **self.kwargs.get("vasprun_kwargs", {}))
 
         run_metadata = {
             # incars need to be as dict without module keys otherwise not JSONable:
@@ -2099,7 +2099,7 @@ class DefectParser:
                     f"{self.defect_entry.calculation_metadata['bulk_path']}. Using "
                     f"{os.path.basename(bulk_vr_path)} to {_vasp_file_parsing_action_dict['vasprun.xml']}."
                 )
-            self.bulk_vr = get_vasprun(bulk_vr_path)
+            self.bulk_vr = get_vasprun(bulk_vr_path, **self.kwargs.get("vasprun_kwargs", {}))
 
         bulk_sc_structure = self.bulk_vr.initial_structure
 
@@ -2186,7 +2186,7 @@ class DefectParser:
                     f"{bulk_band_gap_path}. Using {os.path.basename(actual_bulk_vr_path)} to "
                     f"{_vasp_file_parsing_action_dict['vasprun.xml']}."
                 )
-            actual_bulk_vr = get_vasprun(actual_bulk_vr_path)
+            actual_bulk_vr = get_vasprun(actual_bulk_vr_path, **self.kwargs.get("vasprun_kwargs", {}))
             band_gap, cbm, vbm, _ = actual_bulk_vr.eigenvalue_band_properties
 
         gap_calculation_metadata = {
@@ -37,6 +37,9 @@ eFNV) were developed, they should be used here.
 
 import os
 import warnings
+from contextlib import nullcontext
+from functools import lru_cache, partial
+from multiprocessing import Pool, cpu_count
 from typing import List, Optional, Union
 
 import matplotlib.pyplot as plt
@@ -46,8 +49,8 @@ from monty.json import MontyDecoder
 from pymatgen.analysis.defects.corrections import freysoldt
 from pymatgen.analysis.defects.utils import CorrectionResult
 from pymatgen.core.periodic_table import Element
+from pymatgen.core.structure import Structure
 from pymatgen.io.vasp.outputs import Locpot, Outcar
-from shakenbreak.plotting import _install_custom_font
 
 from doped import _ignore_pmg_warnings
 from doped.analysis import _convert_dielectric_to_tensor
@@ -55,10 +58,11 @@ from doped.utils.parsing import (
     _get_bulk_supercell,
     _get_defect_supercell,
     _get_defect_supercell_bulk_site_coords,
+    get_core_potentials,
     get_locpot,
     get_outcar,
 )
-from doped.utils.plotting import _get_backend, format_defect_name
+from doped.utils.plotting import _get_backend, _install_custom_font, format_defect_name
 
 warnings.simplefilter("default")
 # `message` only needs to match start of message:
@@ -66,28 +70,40 @@ warnings.filterwarnings("ignore", message="`np.int` is a deprecated alias for th
 warnings.filterwarnings("ignore", message="Use get_magnetic_symmetry()")
 
 
+_ELEMENT_SYMBOLS = frozenset(Element.__members__)  # for checking if legend labels are elements
+
+
+def _is_monty_encoded(obj):
+    return isinstance(obj, dict) and "@module" in obj and "@class" in obj
+
+
 def _monty_decode_nested_dicts(d):
     """
-    Recursively find any dictionaries in defect_entry.calculation_metadata,
-    which may be nested in dicts or in lists of dicts, and decode them.
+    Find any dictionaries in defect_entry.calculation_metadata, which may be
+    nested in dicts or in lists of dicts, and decode them.
+
+    Nested dictionaries are traversed iteratively (with a stack) rather than
+    recursively.
     """
-    for key, value in d.items():
-        if isinstance(value, dict) and all(k not in value for k in ["@module", "@class"]):
-            _monty_decode_nested_dicts(value)
-        elif (
-            isinstance(value, list)
-            and all(isinstance(i, dict) for i in value)
-            and all(k in i for k in ["@module", "@class"] for i in value)
-        ):
-            try:
-                d[key] = [MontyDecoder().process_decoded(i) for i in value]
-            except Exception as exc:
-                print(f"Failed to decode {key} with error {exc!r}")
-        if isinstance(value, dict) and all(k in value for k in ["@module", "@class"]):
-            try:
-                d[key] = MontyDecoder().process_decoded(value)
-            except Exception as exc:
-                print(f"Failed to decode {key} with error {exc!r}")
+    decoder = MontyDecoder()
+    dicts_to_check = [d]
+    while dicts_to_check:
+        current_dict = dicts_to_check.pop()
+        for key, value in current_dict.items():
+            if isinstance(value, dict):
+                if _is_monty_encoded(value):
+                    try:
+                        current_dict[key] = decoder.process_decoded(value)
+                    except Exception as exc:
+                        print(f"Failed to decode {key} with error {exc!r}")
+                elif "@module" not in value and "@class" not in value:
+                    dicts_to_check.append(value)
+
+            elif isinstance(value, list) and all(_is_monty_encoded(i) for i in value):
+                try:
+                    current_dict[key] = [decoder.process_decoded(i) for i in value]
+                except Exception as exc:
+                    print(f"Failed to decode {key} with error {exc!r}")
 
 
 def _check_if_None_and_raise_error_if_so(var, var_name, display_name):
@@ -119,6 +135,77 @@ def _check_if_str_and_get_pmg_obj(locpot_or_outcar, obj_type="locpot"):
     return locpot_or_outcar
 
 
+def _get_site_potentials(outcar, dir_type="bulk"):
+    """
+    Get the atomic site potentials (i.e. -1 * ``Outcar.electrostatic_potential``)
+    from an OUTCAR path or pymatgen ``Outcar`` object.
+
+    If a path is given, only the atomic core potentials are parsed from the
+    file (rather than the full ``Outcar`` object).
+    """
+    if isinstance(outcar, str):
+        core_potentials = get_core_potentials(outcar)
+    else:
+        core_potentials = _check_if_str_and_get_pmg_obj(outcar, obj_type="outcar").electrostatic_potential
+
+    if core_potentials is None:
+        _raise_incomplete_outcar_error(outcar, dir_type=dir_type)
+
+    site_potentials = np.array(core_potentials, dtype=float)  # copy, so input is not modified
+    return np.negative(site_potentials, out=site_potentials)
+
+
+def _get_correction_inputs(defect_entry, dielectric, **kwargs):
+    """
+    Get the inputs which determine the charge correction of ``defect_entry``
+    (when using the LOCPOT/OUTCAR data in its ``calculation_metadata``), as a
+    dict of json-compatible values which is stored in the correction metadata,
+    for ``_get_stored_correction``.
+
+    Returns None if any of the ``kwargs`` are not simple values (in which case
+    the correction is always recomputed).
+    """
+    for key, value in kwargs.items():
+        if isinstance(value, (list, tuple, np.ndarray)) and all(
+            isinstance(i, (int, np.integer)) for i in value
+        ):  # e.g. ``excluded_indices``
+            kwargs[key] = [int(i) for i in value]
+        elif value is not None and not isinstance(value, (bool, int, float, str)):
+            return None
+
+    return {
+        "charge_state": defect_entry.charge_state,
+        "dielectric": np.asarray(dielectric, dtype=float).tolist(),
+        "defect_frac_coords": np.asarray(
+            _get_defect_supercell_bulk_site_coords(defect_entry), dtype=float
+        ).tolist(),
+        **kwargs,
+    }
+
+
+def _get_stored_correction(defect_entry, correction_name, correction_inputs):
+    """
+    Get the ``CorrectionResult`` stored on ``defect_entry`` (in ``corrections``
+    and ``corrections_metadata``) from a previous
+    ``DefectEntry.get_..._correction()`` call, if it was computed with the
+    same ``correction_inputs`` (from ``_get_correction_inputs``), otherwise
+    None.
+    """
+    if correction_inputs is None or correction_name not in getattr(defect_entry, "corrections", {}):
+        return None
+
+    stored_metadata = getattr(defect_entry, "corrections_metadata", {}).get(correction_name)
+    if (
+        not isinstance(stored_metadata, dict)
+        or stored_metadata.get("correction_inputs") != correction_inputs
+    ):
+        return None
+
+    return CorrectionResult(
+        correction_energy=defect_entry.corrections[correction_name], metadata=stored_metadata.copy()
+    )
+
+
 def get_freysoldt_correction(
     defect_entry,
     dielectric: Optional[Union[float, int, np.ndarray, list]] = None,
@@ -198,25 +285,41 @@ def get_freysoldt_correction(
         dielectric = _get_and_check_metadata(defect_entry, "dielectric", "Dielectric constant")
     dielectric = _convert_dielectric_to_tensor(dielectric)
 
-    defect_locpot = defect_locpot or _get_and_check_metadata(
-        defect_entry, "defect_locpot_dict", "Defect LOCPOT"
-    )
-    bulk_locpot = bulk_locpot or _get_and_check_metadata(defect_entry, "bulk_locpot_dict", "Bulk LOCPOT")
-
-    defect_locpot = _check_if_str_and_get_pmg_obj(defect_locpot, obj_type="locpot")
-    bulk_locpot = _check_if_str_and_get_pmg_obj(bulk_locpot, obj_type="locpot")
-
-    fnv_correction = freysoldt.get_freysoldt_correction(
-        q=defect_entry.charge_state,
-        dielectric=dielectric,
-        defect_locpot=defect_locpot,
-        bulk_locpot=bulk_locpot,
-        lattice=_get_defect_supercell(defect_entry).lattice if isinstance(defect_locpot, dict) else None,
-        defect_frac_coords=_get_defect_supercell_bulk_site_coords(
-            defect_entry
-        ),  # _relaxed_ defect location in supercell
-        **kwargs,
+    # reuse the correction stored on the defect entry if already computed with the same inputs (e.g.
+    # when re-plotting or changing ``error_tolerance``), only when using the metadata LOCPOT data:
+    correction_inputs = (
+        _get_correction_inputs(defect_entry, dielectric, **kwargs)
+        if defect_locpot is None and bulk_locpot is None
+        else None
     )
+    fnv_correction = _get_stored_correction(defect_entry, "freysoldt_charge_correction", correction_inputs)
+
+    if fnv_correction is None:
+        defect_locpot = defect_locpot or _get_and_check_metadata(
+            defect_entry, "defect_locpot_dict", "Defect LOCPOT"
+        )
+        bulk_locpot = bulk_locpot or _get_and_check_metadata(
+            defect_entry, "bulk_locpot_dict", "Bulk LOCPOT"
+        )
+
+        defect_locpot = _check_if_str_and_get_pmg_obj(defect_locpot, obj_type="locpot")
+        bulk_locpot = _check_if_str_and_get_pmg_obj(bulk_locpot, obj_type="locpot")
+
+        fnv_correction = freysoldt.get_freysoldt_correction(
+            q=defect_entry.charge_state,
+            dielectric=dielectric,
+            defect_locpot=defect_locpot,
+            bulk_locpot=bulk_locpot,
+            lattice=(
+                _get_defect_supercell(defect_entry).lattice if isinstance(defect_locpot, dict) else None
+            ),
+            defect_frac_coords=_get_defect_supercell_bulk_site_coords(
+                defect_entry
+            ),  # _relaxed_ defect location in supercell
+            **kwargs,
+        )
+        if correction_inputs is not None:
+            fnv_correction.metadata["correction_inputs"] = correction_inputs
 
     if verbose:
         print(f"Calculated Freysoldt (FNV) correction is {fnv_correction.correction_energy:.3f} eV")
@@ -228,14 +331,19 @@ def get_freysoldt_correction(
 
     axis_label_dict = {0: r"$a$-axis", 1: r"$b$-axis", 2: r"$c$-axis"}
     if axis is None:
-        fig, axs = plt.subplots(1, 3, sharey=True, figsize=(12, 3.5), dpi=600)
-        for direction in range(3):
-            plot_FNV(
-                fnv_correction.metadata["plot_data"][direction],
-                ax=axs[direction],
-                title=axis_label_dict[direction],
-                style_file=style_file,
-            )
+        # apply style once here, rather than re-reading the style file for each subplot:
+        style_file = style_file or f"{os.path.dirname(__file__)}/utils/doped.mplstyle"
+        plt.style.use(style_file)  # enforce style, as style.context currently doesn't work with jupyter
+        with plt.style.context(style_file):
+            fig, axs = plt.subplots(1, 3, sharey=True, figsize=(12, 3.5), dpi=600)
+            for direction in range(3):
+                plot_FNV(
+                    fnv_correction.metadata["plot_data"][direction],
+                    ax=axs[direction],
+                    title=axis_label_dict[direction],
+                    style_file=style_file,
+                    _style_applied=True,
+                )
     else:
         fig = plot_FNV(fnv_correction.metadata["plot_data"][axis], title=axis_label_dict[axis])
         # actually an axis object
@@ -246,7 +354,7 @@ def get_freysoldt_correction(
     return fnv_correction, fig
 
 
-def plot_FNV(plot_data, title=None, ax=None, style_file=None):
+def plot_FNV(plot_data, title=None, ax=None, style_file=None, _style_applied=False):
     """
     Plots the planar-averaged electrostatic potential against the long range
     and short range models from the FNV correction method.
@@ -264,6 +372,10 @@ def plot_FNV(plot_data, title=None, ax=None, style_file=None):
          style_file (str):
             Path to a mplstyle file to use for the plot. If None (default), uses
             the default doped style (from doped/utils/doped.mplstyle).
+         _style_applied (bool):
+            Whether the plot style has already been applied by the caller (e.g.
+            when plotting multiple axes in a loop), in which case it is not
+            re-applied here. Default is False.
     """
     if not plot_data["pot_plot_data"]:
         raise ValueError(
@@ -278,9 +390,14 @@ def plot_FNV(plot_data, title=None, ax=None, style_file=None):
     check = plot_data["pot_plot_data"]["check"]
     C = plot_data["pot_plot_data"]["shift"]
 
-    style_file = style_file or f"{os.path.dirname(__file__)}/utils/doped.mplstyle"
-    plt.style.use(style_file)  # enforce style, as style.context currently doesn't work with jupyter
-    with plt.style.context(style_file):
+    if _style_applied:
+        style_context = nullcontext()
+    else:
+        style_file = style_file or f"{os.path.dirname(__file__)}/utils/doped.mplstyle"
+        plt.style.use(style_file)  # enforce style, as style.context currently doesn't work with jupyter
+        style_context = plt.style.context(style_file)
+
+    with style_context:
         if ax is None:
             plt.close("all")  # close any previous figures
             fig, ax = plt.subplots()
@@ -296,13 +413,13 @@ def plot_FNV(plot_data, title=None, ax=None, style_file=None):
         ax.add_artist(leg1)  # so isn't overwritten with later legend call
 
         line4 = ax.axhline(C, color="k", linestyle="--", label=f"Alignment constant C = {C:.3f} V")
-        tmpx = [x[i] for i in range(check[0], check[1])]
+        tmpx = x[check[0] : check[1]]
         poly_coll = ax.fill_between(tmpx, -100, 100, facecolor="red", alpha=0.15, label="Sampling region")
         ax.legend(handles=[line4, poly_coll], loc=8)  # bottom middle legend
 
         ax.set_xlim(round(x[0]), round(x[-1]))
-        ymin = min(*v_R, *dft_diff, *short_range)
-        ymax = max(*v_R, *dft_diff, *short_range)
+        all_potentials = np.concatenate([np.asarray(v_R), np.asarray(dft_diff), np.asarray(short_range)])
+        ymin, ymax = all_potentials.min(), all_potentials.max()
         ax.set_ylim(-0.2 + ymin, 0.2 + ymax)
         ax.set_xlabel(r"Distance along axis ($\AA$)")
         ax.set_ylabel("Potential (V)")
@@ -403,10 +520,8 @@ def get_kumagai_correction(
 
     user_settings.logger.setLevel(logging.CRITICAL)
     from pydefect.analyzer.calc_results import CalcResults
-    from pydefect.analyzer.defect_structure_comparator import DefectStructureComparator
     from pydefect.cli.vasp.make_efnv_correction import calc_max_sphere_radius
     from pydefect.corrections.efnv_correction import ExtendedFnvCorrection, PotentialSite
-    from pydefect.corrections.ewald import Ewald
     from pydefect.corrections.site_potential_plotter import SitePotentialMplPlotter
     from pydefect.defaults import defaults
     from pydefect.util.error_classes import SupercellError
@@ -448,39 +563,54 @@ def get_kumagai_correction(
         """
         if calc_results.structure.lattice != perfect_calc_results.structure.lattice:
             raise SupercellError("The lattice constants for defect and perfect models are different")
-        structure_analyzer = DefectStructureComparator(
+        structure_analyzer = _get_structure_comparator(
             calc_results.structure, perfect_calc_results.structure
         )
         if defect_coords is None:
             defect_coords = structure_analyzer.defect_center_coord
+        defect_coords = np.asarray(defect_coords, dtype=float)  # for vectorised operations below
         lattice = calc_results.structure.lattice
-        sites, rel_coords = [], []
-
-        excluded_indices = [] if excluded_indices is None else [int(i) for i in excluded_indices]
 
-        for d, p in structure_analyzer.atom_mapping.items():
-            if d not in excluded_indices:
-                specie = str(calc_results.structure[d].specie)
-                frac_coords = calc_results.structure[d].frac_coords
-                distance, _ = lattice.get_distance_and_image(defect_coords, frac_coords)
-                pot = calc_results.potentials[d] - perfect_calc_results.potentials[p]
-                sites.append(PotentialSite(specie, distance, pot, None))
-                coord = calc_results.structure[d].frac_coords
-                rel_coords.append([x - y for x, y in zip(coord, defect_coords)])
-
-        lattice = calc_results.structure.lattice
-        ewald = Ewald(lattice.matrix, dielectric_tensor, accuracy=accuracy)
-        point_charge_correction = -ewald.lattice_energy * charge**2 if charge else 0.0
+        excluded_indices = frozenset(int(i) for i in (excluded_indices or []))  # O(1) lookups
+        atom_mapping = {
+            d: p for d, p in structure_analyzer.atom_mapping.items() if d not in excluded_indices
+        }
+
+        # vectorised over all sites (rather than looping over ``atom_mapping`` as in ``pydefect``):
+        defect_idxs = np.fromiter(atom_mapping.keys(), dtype=int, count=len(atom_mapping))
+        bulk_idxs = np.fromiter(atom_mapping.values(), dtype=int, count=len(atom_mapping))
+        frac_coords = calc_results.structure.frac_coords[defect_idxs]
+        distances = lattice.get_all_distances(defect_coords, frac_coords)[0]  # minimum image distances
+        pot_diffs = (
+            np.asarray(calc_results.potentials)[defect_idxs]
+            - np.asarray(perfect_calc_results.potentials)[bulk_idxs]
+        )
+        species = [str(calc_results.structure[d].specie) for d in defect_idxs]
+        rel_coords = frac_coords - defect_coords
 
         if defect_region_radius is None:
             defect_region_radius = calc_max_sphere_radius(lattice.matrix)
 
-        for site, rel_coord in zip(sites, rel_coords):
-            if site.distance > defect_region_radius:
-                if charge == 0:
-                    site.pc_potential = 0
-                else:
-                    site.pc_potential = ewald.atomic_site_potential(rel_coord) * charge * unit_conversion
+        # evaluate PC potentials for all sites outside the defect region at once (NaN for sites within):
+        far_from_defect = distances > defect_region_radius
+        pc_potentials = np.full(len(distances), np.nan)
+        if charge != 0:
+            ewald = _get_ewald(lattice.matrix, dielectric_tensor, accuracy)
+            point_charge_correction = -_get_ewald_lattice_energy(ewald) * charge**2
+            pc_potentials[far_from_defect] = (
+                _get_ewald_site_potentials(ewald, rel_coords[far_from_defect]) * charge * unit_conversion
+            )
+        else:  # no point-charge contributions for neutral defects, so no need to set up the Ewald sum
+            point_charge_correction = 0.0
+            pc_potentials[far_from_defect] = 0
+
+        # only build the ``PotentialSite`` objects (as required by ``pydefect``) at the end:
+        sites = [
+            PotentialSite(specie, distance, pot, None if np.isnan(pc_potential) else pc_potential)
+            for specie, distance, pot, pc_potential in zip(
+                species, distances.tolist(), pot_diffs.tolist(), pc_potentials.tolist()
+            )
+        ]
 
         return ExtendedFnvCorrection(
             charge=charge,
@@ -498,72 +628,99 @@ def get_kumagai_correction(
         dielectric = _get_and_check_metadata(defect_entry, "dielectric", "Dielectric constant")
     dielectric = _convert_dielectric_to_tensor(dielectric)
 
-    if defect_outcar is not None:
-        defect_outcar = _check_if_str_and_get_pmg_obj(defect_outcar, obj_type="outcar")
-        if defect_outcar.electrostatic_potential is None:
-            _raise_incomplete_outcar_error(defect_outcar, dir_type="defect")
-        defect_site_potentials = -1 * np.array(defect_outcar.electrostatic_potential)
-    else:
-        defect_site_potentials = _get_and_check_metadata(
-            defect_entry, "defect_site_potentials", "Defect OUTCAR (for atomic site potentials)"
+    # reuse the correction stored on the defect entry if already computed with the same inputs (e.g.
+    # when re-plotting or changing ``error_tolerance``), only when using the metadata site potentials:
+    correction_inputs = (
+        _get_correction_inputs(
+            defect_entry,
+            dielectric,
+            defect_region_radius=defect_region_radius,
+            excluded_indices=excluded_indices,
+            **kwargs,
         )
+        if defect_outcar is None and bulk_outcar is None
+        else None
+    )
+    kumagai_correction_result = _get_stored_correction(
+        defect_entry, "kumagai_charge_correction", correction_inputs
+    )
+    if kumagai_correction_result is not None and isinstance(
+        kumagai_correction_result.metadata.get("pydefect_ExtendedFnvCorrection"), ExtendedFnvCorrection
+    ):  # ``ExtendedFnvCorrection`` becomes a dict when reloaded from json, so recomputed in this case
+        efnv_correction = kumagai_correction_result.metadata["pydefect_ExtendedFnvCorrection"]
 
-    if bulk_outcar is not None:
-        bulk_outcar = _check_if_str_and_get_pmg_obj(bulk_outcar, obj_type="outcar")
-        if bulk_outcar.electrostatic_potential is None:
-            _raise_incomplete_outcar_error(bulk_outcar, dir_type="bulk")
-        bulk_site_potentials = -1 * np.array(bulk_outcar.electrostatic_potential)
     else:
-        bulk_site_potentials = _get_and_check_metadata(
-            defect_entry, "bulk_site_potentials", "Bulk OUTCAR (for atomic site potentials)"
-        )
-
-    defect_supercell = _get_defect_supercell(defect_entry).copy()
-    defect_supercell.remove_oxidation_states()  # pydefect needs structure without oxidation states
-    defect_calc_results_for_eFNV = CalcResults(
-        structure=defect_supercell,
-        energy=np.inf,
-        magnetization=np.inf,
-        potentials=defect_site_potentials,
-    )
+        if defect_outcar is not None:
+            defect_site_potentials = _get_site_potentials(defect_outcar, dir_type="defect")
+        else:
+            defect_site_potentials = np.asarray(
+                _get_and_check_metadata(
+                    defect_entry, "defect_site_potentials", "Defect OUTCAR (for atomic site potentials)"
+                ),
+                dtype=float,
+            )
 
-    bulk_supercell = _get_bulk_supercell(defect_entry).copy()
-    bulk_supercell.remove_oxidation_states()  # pydefect needs structure without oxidation states
-    if bulk_supercell.lattice != defect_supercell.lattice:  # pydefect will crash
-        # check if the difference is tolerable (< 0.01 Å)
-        if np.allclose(bulk_supercell.lattice.matrix, defect_supercell.lattice.matrix, atol=1e-2):
-            # scale bulk lattice to match defect lattice:
-            bulk_supercell.scale_lattice(defect_supercell.lattice.volume)
+        if bulk_outcar is not None:
+            bulk_site_potentials = _get_site_potentials(bulk_outcar, dir_type="bulk")
         else:
-            raise ValueError(
-                f"Bulk and defect supercells have different lattices, and so the eFNV (Kumagai) "
-                f"correction cannot be computed!\nBulk lattice:\n{bulk_supercell.lattice}\nDefect "
-                f"lattice:\n{defect_supercell.lattice}"
+            bulk_site_potentials = np.asarray(
+                _get_and_check_metadata(
+                    defect_entry, "bulk_site_potentials", "Bulk OUTCAR (for atomic site potentials)"
+                ),
+                dtype=float,
             )
 
-    bulk_calc_results_for_eFNV = CalcResults(
-        structure=bulk_supercell,
-        energy=np.inf,
-        magnetization=np.inf,
-        potentials=bulk_site_potentials,
-    )
+        defect_supercell = _get_defect_supercell(defect_entry).copy()
+        defect_supercell.remove_oxidation_states()  # pydefect needs structure without oxidation states
+        defect_calc_results_for_eFNV = CalcResults(
+            structure=defect_supercell,
+            energy=np.inf,
+            magnetization=np.inf,
+            potentials=defect_site_potentials,
+        )
 
-    efnv_correction = doped_make_efnv_correction(
-        charge=defect_entry.charge_state,
-        calc_results=defect_calc_results_for_eFNV,
-        perfect_calc_results=bulk_calc_results_for_eFNV,
-        dielectric_tensor=dielectric,
-        defect_coords=_get_defect_supercell_bulk_site_coords(
-            defect_entry
-        ),  # _relaxed_ defect coords (except for vacancies)
-        defect_region_radius=defect_region_radius,
-        excluded_indices=excluded_indices,
-        **kwargs,
-    )
-    kumagai_correction_result = CorrectionResult(
-        correction_energy=efnv_correction.correction_energy,
-        metadata={"pydefect_ExtendedFnvCorrection": efnv_correction},
-    )
+        bulk_supercell = _get_bulk_supercell(defect_entry).copy()
+        bulk_supercell.remove_oxidation_states()  # pydefect needs structure without oxidation states
+        if (  # exact match fast path (typical case), before the tolerance-based ``Lattice`` comparison
+            bulk_supercell.lattice.matrix.tobytes() != defect_supercell.lattice.matrix.tobytes()
+            or bulk_supercell.lattice.pbc != defect_supercell.lattice.pbc
+        ) and bulk_supercell.lattice != defect_supercell.lattice:  # pydefect will crash
+            # check if the difference is tolerable (< 0.01 Å)
+            if np.allclose(bulk_supercell.lattice.matrix, defect_supercell.lattice.matrix, atol=1e-2):
+                # scale bulk lattice to match defect lattice:
+                bulk_supercell.scale_lattice(defect_supercell.lattice.volume)
+            else:
+                raise ValueError(
+                    f"Bulk and defect supercells have different lattices, and so the eFNV (Kumagai) "
+                    f"correction cannot be computed!\nBulk lattice:\n{bulk_supercell.lattice}\nDefect "
+                    f"lattice:\n{defect_supercell.lattice}"
+                )
+
+        bulk_calc_results_for_eFNV = CalcResults(
+            structure=bulk_supercell,
+            energy=np.inf,
+            magnetization=np.inf,
+            potentials=bulk_site_potentials,
+        )
+
+        efnv_correction = doped_make_efnv_correction(
+            charge=defect_entry.charge_state,
+            calc_results=defect_calc_results_for_eFNV,
+            perfect_calc_results=bulk_calc_results_for_eFNV,
+            dielectric_tensor=dielectric,
+            defect_coords=_get_defect_supercell_bulk_site_coords(
+                defect_entry
+            ),  # _relaxed_ defect coords (except for vacancies)
+            defect_region_radius=defect_region_radius,
+            excluded_indices=excluded_indices,
+            **kwargs,
+        )
+        kumagai_correction_result = CorrectionResult(
+            correction_energy=efnv_correction.correction_energy,
+            metadata={"pydefect_ExtendedFnvCorrection": efnv_correction},
+        )
+        if correction_inputs is not None:
+            kumagai_correction_result.metadata["correction_inputs"] = correction_inputs
 
     if verbose:
         print(
@@ -603,16 +760,13 @@ def get_kumagai_correction(
         # update legend:
         handles, labels = ax.get_legend_handles_labels()
         labels = [
-            label.replace("point charge", "Point Charge (PC)").replace(
+            label + r" ($V_{defect} - V_{bulk}$)"
+            if label in _ELEMENT_SYMBOLS
+            else label.replace("point charge", "Point Charge (PC)").replace(
                 "potential difference", r"$\Delta V$"
             )
             for label in labels
         ]
-        dummy_h = Element("H")  # dummy element to check if valid symbol
-        labels = [
-            label + r" ($V_{defect} - V_{bulk}$)" if dummy_h.is_valid_symbol(label) else label
-            for label in labels
-        ]
 
         # add entry for dashed red line:
         handles += [Line2D([0], [0], **spp._mpl_defaults.hline)]
@@ -629,6 +783,203 @@ def get_kumagai_correction(
     return kumagai_correction_result, fig
 
 
+def get_kumagai_corrections(
+    defect_entries: List,
+    processes: Optional[int] = None,
+    **kwargs,
+) -> List:
+    """
+    Compute the Kumagai (eFNV) finite-size charge corrections for multiple
+    defect entries, using multiprocessing to compute the corrections for
+    different entries in parallel (as each is independent).
+
+    This function `does not` add the corrections to the ``DefectEntry.corrections``
+    attributes; see ``get_kumagai_correction`` for details.
+
+    Args:
+        defect_entries (list):
+            List of DefectEntry objects for which to compute the Kumagai
+            finite-size charge corrections.
+        processes (int):
+            Number of processes to use for multiprocessing. If not set, defaults
+            to one less than the number of CPUs available (capped at the number
+            of defect entries). If 1, the corrections are computed serially.
+        **kwargs:
+            Additional kwargs to pass to ``get_kumagai_correction`` (e.g.
+            ``dielectric``, ``defect_region_radius``, ``verbose`` etc.), which
+            are applied to all defect entries. If supplying ``defect_outcar``
+            or ``bulk_outcar``, paths (rather than parsed ``Outcar`` objects)
+            should be used to reduce memory usage and inter-process transfer.
+
+    Returns:
+        List of the outputs of ``get_kumagai_correction`` for each defect entry,
+        in the same order as ``defect_entries``.
+    """
+    defect_entries = list(defect_entries)
+    if processes is None:
+        processes = min(max(1, cpu_count() - 1), len(defect_entries))
+
+    kumagai_correction_func = partial(get_kumagai_correction, **kwargs)
+    if processes <= 1:  # no multiprocessing, and reuse cached Ewald sums etc. between entries
+        return [kumagai_correction_func(defect_entry) for defect_entry in defect_entries]
+
+    with Pool(processes=processes) as pool:
+        return pool.map(kumagai_correction_func, defect_entries)
+
+
+def _get_ewald(lattice_matrix, dielectric_tensor, accuracy):
+    """
+    Get the ``pydefect`` ``Ewald`` object for the given supercell lattice
+    matrix, dielectric tensor and Ewald accuracy, reusing a cached object if
+    one has already been generated for the same inputs (e.g. when computing
+    the eFNV correction for multiple defects in the same host supercell).
+
+    The returned ``Ewald`` object is shared between calls, and so should not
+    be modified.
+    """
+    return _get_cached_ewald(
+        np.asarray(lattice_matrix, dtype=float).tobytes(),
+        np.asarray(dielectric_tensor, dtype=float).tobytes(),
+        accuracy,
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_cached_ewald(lattice_bytes, dielectric_bytes, accuracy):
+    from pydefect.corrections.ewald import Ewald
+
+    return Ewald(
+        np.frombuffer(lattice_bytes).reshape(3, 3),
+        np.frombuffer(dielectric_bytes).reshape(3, 3),
+        accuracy=accuracy,
+    )
+
+
+def _get_structure_comparator(defect_structure, bulk_structure):
+    """
+    Get the ``pydefect`` ``DefectStructureComparator`` object (which determines
+    the defect -> bulk supercell atom mapping) for the given defect and bulk
+    supercells, reusing a cached object if the same pair of structures has
+    already been compared (e.g. when re-computing the eFNV correction for the
+    same defect with a different sampling region, or for plotting).
+
+    Structures are keyed on their lattice, species and fractional coordinates,
+    and the returned object is shared between calls, and so should not be
+    modified.
+    """
+    return _get_cached_structure_comparator(
+        _get_structure_key(defect_structure), _get_structure_key(bulk_structure)
+    )
+
+
+def _get_structure_key(structure):
+    return (
+        np.asarray(structure.lattice.matrix, dtype=float).tobytes(),
+        tuple(str(site.specie) for site in structure),
+        np.asarray(structure.frac_coords, dtype=float).tobytes(),
+    )
+
+
+def _get_structure_from_key(structure_key):
+    lattice_bytes, species, frac_coords_bytes = structure_key
+    return Structure(
+        np.frombuffer(lattice_bytes).reshape(3, 3),
+        list(species),
+        np.frombuffer(frac_coords_bytes).reshape(-1, 3),
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_cached_structure_comparator(defect_structure_key, bulk_structure_key):
+    from pydefect.analyzer.defect_structure_comparator import DefectStructureComparator
+
+    return DefectStructureComparator(
+        _get_structure_from_key(defect_structure_key), _get_structure_from_key(bulk_structure_key)
+    )
+
+
+def _get_ewald_site_potentials(ewald, rel_coords, chunk_size=100):
+    """
+    Vectorised version of ``pydefect``'s ``Ewald.atomic_site_potential()``,
+    which evaluates the (anisotropic) point-charge potential at each of the
+    input ``rel_coords`` (fractional coordinates relative to the defect
+    position), generating the real- and reciprocal-space lattice vector sets
+    only once rather than for each site.
+
+    Args:
+        ewald (Ewald):
+            ``pydefect`` ``Ewald`` object for the supercell lattice and
+            dielectric tensor.
+        rel_coords (np.ndarray):
+            (N, 3) array of fractional coordinates relative to the defect.
+        chunk_size (int):
+            Number of sites to evaluate at once, to limit memory usage for
+            large supercells (default = 100).
+
+    Returns:
+        np.ndarray of the point-charge site potentials (in units of
+        ``ewald``; i.e. not yet multiplied by the charge or unit conversion).
+    """
+    from scipy.special import erfc
+
+    cart_coords = np.asarray(rel_coords, dtype=float).reshape(-1, 3) @ ewald.lattice
+    r_lattice, g_lattice, g_weights = _get_ewald_lattice_sets(ewald)
+
+    site_potentials = np.empty(len(cart_coords))
+    for start in range(0, len(cart_coords), chunk_size):
+        chunk_coords = cart_coords[start : start + chunk_size]
+        r_vecs = r_lattice[np.newaxis, :, :] - chunk_coords[:, np.newaxis, :]
+        root_r_inv_epsilon_r = np.sqrt(np.einsum("sij,jk,sik->si", r_vecs, ewald.epsilon_inv, r_vecs))
+        real_part = np.sum(
+            erfc(ewald.mod_ewald_param * root_r_inv_epsilon_r) / root_r_inv_epsilon_r, axis=1
+        ) / (4 * np.pi * ewald.root_epsilon)
+        rec_part = np.cos(chunk_coords @ g_lattice.T) @ g_weights / ewald.volume
+        site_potentials[start : start + chunk_size] = real_part + rec_part + ewald.diff_pot
+
+    return site_potentials
+
+
+@lru_cache(maxsize=32)
+def _get_ewald_lattice_sets(ewald):
+    """
+    Get the (unshifted) real-space lattice vectors, reciprocal-space lattice
+    vectors and reciprocal-space (Gaussian-damped) weights for the given
+    ``Ewald`` object, which depend only on the lattice, dielectric tensor and
+    Ewald parameters, and so are only generated once for each (cached)
+    ``Ewald`` object.
+    """
+    r_lattice = ewald.r_lattice_set(include_self=True)
+    g_lattice = ewald.g_lattice_set()
+    g_epsilon_g = np.einsum("ij,jk,ik->i", g_lattice, ewald.dielectric_tensor, g_lattice)
+    g_weights = np.exp(-g_epsilon_g / 4 / ewald.mod_ewald_param**2) / g_epsilon_g
+    for array in (r_lattice, g_lattice, g_weights):
+        array.flags.writeable = False  # shared between calls
+
+    return r_lattice, g_lattice, g_weights
+
+
+@lru_cache(maxsize=32)
+def _get_ewald_lattice_energy(ewald):
+    """
+    Vectorised version of ``pydefect``'s ``Ewald.lattice_energy`` property
+    (which is re-evaluated in a Python loop over all lattice vectors on each
+    access), using the cached lattice vector sets from
+    ``_get_ewald_lattice_sets`` and only computed once for each (cached)
+    ``Ewald`` object.
+    """
+    from scipy.special import erfc
+
+    r_lattice, _g_lattice, g_weights = _get_ewald_lattice_sets(ewald)
+    r_lattice = r_lattice[np.any(r_lattice != 0, axis=1)]  # exclude self (origin)
+    root_r_inv_epsilon_r = np.sqrt(np.einsum("ij,jk,ik->i", r_lattice, ewald.epsilon_inv, r_lattice))
+    real_part = np.sum(erfc(ewald.mod_ewald_param * root_r_inv_epsilon_r) / root_r_inv_epsilon_r) / (
+        4 * np.pi * ewald.root_epsilon
+    )
+    rec_part = np.sum(g_weights) / ewald.volume
+
+    return (real_part + rec_part + ewald.diff_pot + ewald.self_pot) / 2
+
+
 def _raise_incomplete_outcar_error(outcar, dir_type="bulk"):
     """
     Raise error about supplied OUTCAR not having atomic core potential info.
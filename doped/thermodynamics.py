@@ -38,7 +38,7 @@ from doped.utils.parsing import (
     get_orientational_degeneracy,
     get_vasprun,
 )
-from doped.utils.plotting import _rename_key_and_dicts, _TLD_plot
+from doped.utils.plotting import _install_custom_font, _rename_key_and_dicts, _TLD_plot
 from doped.utils.symmetry import _get_all_equiv_sites, _get_sga, point_symmetry_from_defect_entry
 
 
@@ -2217,8 +2217,6 @@ class DefectThermodynamics(MSONable):
             Matplotlib Figure object, or list of Figure objects if multiple limits
             chosen.
         """
-        from shakenbreak.plotting import _install_custom_font
-
         _install_custom_font()
         # check input options:
         if all_entries not in [False, True, "faded"]:
@@ -4,10 +4,12 @@ Helper functions for parsing VASP supercell defect calculations.
 import contextlib
 import itertools
 import os
+import re
 import warnings
 from typing import Optional, Union
 
 import numpy as np
+from monty.io import zopen
 from monty.serialization import loadfn
 from pymatgen.analysis.defects.core import DefectType
 from pymatgen.core.structure import PeriodicSite, Structure
@@ -72,6 +74,40 @@ def get_locpot(locpot_path):
     return locpot
 
 
+def get_locpot_planar_averages(locpot_path):
+    """
+    Get the planar-averaged electrostatic potential along each lattice vector
+    from the LOCPOT(.gz) file, in the form
+    ``{i: Locpot.get_average_along_axis(i) for i in [0, 1, 2]}``.
+
+    Only the first (total) potential grid in the file is parsed, in a single
+    pass with ``numpy``, rather than building the full pymatgen ``Locpot``
+    object (which is much slower for large LOCPOT files).
+    """
+    locpot_path = str(locpot_path)  # convert to string if Path object
+    try:
+        locpot_path = find_archived_fname(locpot_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"LOCPOT or compressed version not found at (.gz/.xz/.bz/.lzma) not found at {locpot_path}("
+            f".gz/.xz/.bz/.lzma). Needed for calculating the Freysoldt (FNV) image charge correction!"
+        ) from None
+
+    with zopen(locpot_path, "rt") as f:
+        f.readline()  # comment line
+        while f.readline().strip():  # skip structure block, which ends with a blank line
+            pass
+        grid_dims = [int(i) for i in f.readline().split()]
+        num_grid_points = int(np.prod(grid_dims))
+        data = np.fromstring(f.read(), sep=" ", count=num_grid_points)
+
+    if len(grid_dims) != 3 or data.size != num_grid_points:
+        raise ValueError(f"Unable to parse the potential grid from the LOCPOT file at {locpot_path}!")
+
+    data = data.reshape(grid_dims, order="F")  # VASP writes with x as the fastest index
+    return {i: data.mean(axis=tuple(j for j in range(3) if j != i)) for i in range(3)}
+
+
 def get_outcar(outcar_path):
     """
     Read the OUTCAR(.gz) file as a pymatgen Outcar object.
@@ -87,6 +123,43 @@ def get_outcar(outcar_path):
     return outcar
 
 
+def get_core_potentials(outcar_path):
+    """
+    Get the average electrostatic potentials at the atomic cores (i.e.
+    ``Outcar.electrostatic_potential``) for the final ionic step from the
+    OUTCAR(.gz) file, or None if not present in the OUTCAR.
+
+    Only the final complete core potentials block is parsed (as in
+    ``Outcar.read_electrostatic_potential()``, so that OUTCARs cut off during
+    an ionic step still parse), rather than building the full pymatgen
+    ``Outcar`` object (which parses many other quantities).
+    """
+    outcar_path = str(outcar_path)  # convert to string if Path object
+    try:
+        outcar_path = find_archived_fname(outcar_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"OUTCAR file not found at {outcar_path}. Needed for calculating the Kumagai (eFNV) "
+            f"image charge correction."
+        ) from None
+
+    with zopen(outcar_path, "rt") as f:
+        outcar_text = f.read()
+
+    # search backwards for the last header followed by a complete table (ending with "E-fermi :"):
+    header_idx = len(outcar_text)
+    while (header_idx := outcar_text.rfind("(the norm of the test charge is", 0, header_idx)) != -1:
+        table_start = outcar_text.find("\n", header_idx)
+        table_end = outcar_text.find("E-fermi :", table_start) if table_start != -1 else -1
+        if table_end != -1:
+            # same regex as used in ``Outcar.read_electrostatic_potential()``:
+            return [
+                float(i) for i in re.findall(r"\s+\d+\s*([\.\-\d]+)+", outcar_text[table_start:table_end])
+            ]
+
+    return None
+
+
 def _get_output_files_and_check_if_multiple(output_file="vasprun.xml", path="."):
     """
     Search for all files with filenames matching ``output_file``,
@@ -416,11 +489,14 @@ def check_atom_mapping_far_from_defect(bulk, defect, defect_coords):
 
     wigner_seitz_radius = calc_max_sphere_radius(bulk.lattice.matrix)
 
+    # minimum image distances of all sites to the defect, computed at once:
+    bulk_site_distances = bulk.lattice.get_all_distances(defect_coords, bulk.frac_coords)[0]
+    defect_site_distances = defect.lattice.get_all_distances(defect_coords, defect.frac_coords)[0]
+
     bulk_sites_outside_or_at_wigner_radius = [
         site
-        for site in bulk
-        if site.distance_and_image_from_frac_coords(defect_coords)[0]
-        > np.max((wigner_seitz_radius - 1, 1))
+        for site, distance in zip(bulk, bulk_site_distances)
+        if distance > np.max((wigner_seitz_radius - 1, 1))
     ]
 
     bulk_species_coord_dict = {}
@@ -430,8 +506,8 @@ def check_atom_mapping_far_from_defect(bulk, defect, defect_coords):
         )
         bulk_species_coord_dict[species.name] = bulk_species_coords
 
-    for site in defect:
-        if site.distance_and_image_from_frac_coords(defect_coords)[0] > wigner_seitz_radius:
+    for site, distance in zip(defect, defect_site_distances):
+        if distance > wigner_seitz_radius:
             bulk_site_arg_idx = find_nearest_coords(  # get closest site in bulk to defect site
                 bulk_species_coord_dict[site.specie.symbol],
                 site.frac_coords,
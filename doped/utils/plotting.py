@@ -9,6 +9,7 @@ analysing defect calculations, with publication-quality outputs.
 import contextlib
 import re
 import warnings
+from functools import lru_cache
 from typing import List, Optional, Union
 
 import matplotlib.pyplot as plt
@@ -20,6 +21,19 @@ from pymatgen.util.string import latexify
 from doped.utils.symmetry import sch_symbols  # point group symbols
 
 
+@lru_cache(maxsize=None)
+def _install_custom_font():
+    """
+    Install the custom (ShakeNBreak) plotting font if not already installed,
+    only checking once per session (as ``shakenbreak``'s
+    ``_install_custom_font()`` re-scans the matplotlib font directory on
+    each call).
+    """
+    from shakenbreak.plotting import _install_custom_font as _install_snb_custom_font
+
+    _install_snb_custom_font()
+
+
 def _get_backend(save_format: str) -> Optional[str]:
     """
     Try use pycairo as backend if installed, and save_format is pdf.
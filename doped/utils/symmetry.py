@@ -2,8 +2,10 @@
 Utility code and functions for symmetry analysis of structures and defects.
 """
 
+import copy
 import os
 import warnings
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -736,6 +738,17 @@ def get_wyckoff_dict_from_sgn(sgn):
     By default, doped uses the Wyckoff functionality of spglib (along with
     symmetry operations in pymatgen) when possible however.
     """
+    # parsing the sympy coordinate expressions is slow, so the dict for each sgn is
+    # cached and a copy returned:
+    return copy.deepcopy(_get_wyckoff_dict_from_sgn(sgn))
+
+
+@lru_cache(maxsize=None)
+def _get_wyckoff_dict_from_sgn(sgn):
+    """
+    Cached parsing of the Wyckoff labels and coordinates for ``sgn``, see
+    ``get_wyckoff_dict_from_sgn``.
+    """
     datafile = _get_wyckoff_datafile()
     with open(datafile, encoding="utf-8") as f:
         wyckoff = _read_wyckoff_datafile(sgn, f)
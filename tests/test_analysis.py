@@ -3,32 +3,48 @@ Tests for the `doped.analysis` module, which also implicitly tests most of the
 `doped.utils.parsing` module.
 """
 
+import contextlib
+import copy
 import gzip
+import math
 import os
+import re
 import shutil
+import tempfile
+import types
 import unittest
 import warnings
+from functools import lru_cache
 from unittest.mock import patch
 
 import matplotlib as mpl
+import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 from monty.serialization import dumpfn, loadfn
-from pymatgen.core.structure import Structure
+from pydefect.analyzer.calc_results import CalcResults
+from pydefect.cli.vasp.make_efnv_correction import make_efnv_correction
+from pymatgen.core.structure import Lattice, Structure
+from pymatgen.io.vasp.inputs import Poscar
+from pymatgen.io.vasp.outputs import Locpot, Outcar
+from shakenbreak.input import _get_voronoi_nodes
 from test_thermodynamics import custom_mpl_image_compare
 
 from doped.analysis import (
     DefectParser,
     DefectsParser,
+    _get_bulk_locpot_dict,
+    _get_bulk_site_potentials,
     defect_entry_from_paths,
-    defect_from_structures,
     defect_name_from_structures,
 )
 from doped.core import _orientational_degeneracy_warning
 from doped.generation import DefectsGenerator, get_defect_name_from_defect, get_defect_name_from_entry
 from doped.utils.parsing import (
+    get_core_potentials,
     get_defect_site_idxs_and_unrelaxed_structure,
     get_defect_type_and_composition_diff,
-    get_outcar,
+    get_locpot_planar_averages,
     get_vasprun,
 )
 
@@ -46,32 +62,186 @@ def if_present_rm(path):
             shutil.rmtree(path)
 
 
+def _fixture_link(src, dst):
+    """
+    Link (rather than copy) a fixture file to ``dst``, for tests which only
+    need a duplicate file to be present. Tries a hard link, then a symlink,
+    then falls back to copying.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            os.symlink(os.path.abspath(src), dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+
+def _is_generated_json(filename):
+    """
+    Whether ``filename`` is one of the ``json`` files generated by doped when
+    parsing (the bulk ``voronoi_nodes.json`` and the ``DefectsParser`` json
+    outputs written in the ``DefectsParsingTestCase`` tests), rather than a
+    fixture file.
+    """
+    return filename in {"voronoi_nodes.json", "test_pop.json"} or filename.endswith("_defect_dict.json")
+
+
+def _link_fixture_tree(src_dir, dst_dir):
+    """
+    Recreate the ``src_dir`` fixture tree in ``dst_dir``, with the fixture
+    files linked rather than copied (see ``_fixture_link``), so that tests
+    can freely add, move and remove files in ``dst_dir``. Generated ``json``
+    outputs are skipped, as these are rewritten in place by doped and can be
+    written and removed concurrently by other tests using ``src_dir``.
+    """
+    for root, _dirs, files in os.walk(src_dir):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(dst_root, exist_ok=True)
+        for file in files:
+            if not _is_generated_json(file):
+                _fixture_link(os.path.join(root, file), os.path.join(dst_root, file))
+
+    return dst_dir
+
+
+@contextlib.contextmanager
+def _hidden_files(directory, *filenames):
+    """
+    Hide the files ``filenames`` in ``directory`` from the doped output file
+    lookups (which use ``os.listdir`` in ``doped.analysis`` and
+    ``doped.utils.parsing``) within this context, rather than moving them on
+    disk. Only ``os`` as seen by these modules is patched, not ``os.listdir``
+    for the whole process.
+    """
+    directory = os.path.abspath(directory)
+
+    def _listdir(path="."):
+        files = os.listdir(path)
+        if os.path.abspath(path) == directory:
+            return [file for file in files if file not in filenames]
+        return files
+
+    os_with_hidden_files = types.SimpleNamespace(**{**vars(os), "listdir": _listdir})
+    with patch("doped.analysis.os", new=os_with_hidden_files), patch(
+        "doped.utils.parsing.os", new=os_with_hidden_files
+    ):
+        yield
+
+
+_v_Cd_charge_regex = re.compile(r"v_Cd_(-?\d+)")
+_folder_charge_regex = re.compile(r"_([+-]?\d+)$")  # charge state at end of defect folder name
+
+
+_aniso_no_outcar_warning_parts = (
+    "An anisotropic dielectric constant was supplied, but `OUTCAR` files (needed to compute the "
+    "_anisotropic_ Kumagai eFNV charge correction) are missing from the defect or bulk folder.",
+    "`LOCPOT` files were found in both defect & bulk folders, and so the Freysoldt (FNV) charge "
+    "correction developed for _isotropic_ materials will be applied here, which corresponds to using the "
+    "effective isotropic average of the supplied anisotropic dielectric. This could lead to significant "
+    "errors for very anisotropic systems and/or relatively small supercells!",
+)
+_aniso_no_outcar_warning = "\n".join(_aniso_no_outcar_warning_parts)
+
+_multiple_files_usage = {
+    "OUTCAR": "parse core levels and compute the Kumagai (eFNV) image charge correction",
+    "LOCPOT": "parse the electrostatic potential and compute the Freysoldt (FNV) charge correction",
+    "vasprun.xml": "parse the calculation energy and metadata",
+}
+
+
+@lru_cache(maxsize=None)
+def _multiple_files_warning(filename, dir_type, directory):
+    """
+    Expected warning message when multiple ``filename`` files are present in
+    the ``dir_type`` (``"bulk"`` or ``"defect"``) ``directory``.
+    """
+    return (
+        f"Multiple `{filename}` files found in {dir_type} directory: {directory}. Using {filename}.gz to "
+        f"{_multiple_files_usage[filename]}."
+    )
+
+
+def _frac_coords_close(frac_coords, target_frac_coords, tol=1.5e-6):
+    """
+    Check that ``frac_coords`` match ``target_frac_coords`` to within ``tol``
+    (default matching ``np.testing.assert_array_almost_equal``), without the
+    ``numpy`` array machinery for these small 3-vectors.
+    """
+    return max(abs(x - y) for x, y in zip(frac_coords, target_frac_coords)) < tol
+
+
+def _mic_distance(site, frac_coords):
+    """
+    Minimum-image distance between ``site`` and ``frac_coords``, computed
+    directly rather than with ``PeriodicSite.distance_and_image_from_frac_coords``
+    (valid for the short distances checked in these tests).
+    """
+    frac_diff = site.frac_coords - np.asarray(frac_coords)
+    frac_diff -= np.round(frac_diff)
+    return np.linalg.norm(frac_diff @ site.lattice.matrix)
+
+
+@lru_cache(maxsize=8)
+def _make_calc_results(directory):
+    """
+    Get the ``pydefect`` ``CalcResults`` for the VASP calculation in
+    ``directory``, cached as these are only read (not modified) in the tests.
+
+    The core potentials are parsed with ``pymatgen``'s ``Outcar`` (as in
+    ``pydefect``) rather than doped's ``get_core_potentials``, so that this
+    reference is independent of the doped parsing being tested.
+    """
+    vasprun = get_vasprun(f"{directory}/vasprun.xml.gz", parse_dos=False)
+    outcar = Outcar(f"{directory}/OUTCAR.gz")
+    return CalcResults(
+        structure=vasprun.final_structure,
+        energy=vasprun.final_energy,
+        magnetization=0.0,  # not used for the eFNV correction
+        potentials=[-p for p in outcar.electrostatic_potential],
+        electronic_conv=vasprun.converged_electronic,
+        ionic_conv=vasprun.converged_ionic,
+    )
+
+
 # TODO: Add additional extrinsic defects test with our CdTe alkali defects (parsing & plotting)
 
 
+# these tests write (and remove) the parsed outputs in the shared example folders, so must run on
+# one ``pytest-xdist`` worker (``--dist loadgroup``):
+@pytest.mark.xdist_group("defects_parsing")
 class DefectsParsingTestCase(unittest.TestCase):
-    def setUp(self):
-        self.module_path = os.path.dirname(os.path.abspath(__file__))
-        self.EXAMPLE_DIR = os.path.join(self.module_path, "../examples")
-        self.CdTe_EXAMPLE_DIR = os.path.join(self.module_path, "../examples/CdTe")
-        self.CdTe_BULK_DATA_DIR = os.path.join(self.CdTe_EXAMPLE_DIR, "CdTe_bulk/vasp_ncl")
-        self.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
-
-        self.YTOS_EXAMPLE_DIR = os.path.join(self.module_path, "../examples/YTOS")
-        self.ytos_dielectric = [  # from legacy Materials Project
-            [40.71948719643814, -9.282128210266565e-14, 1.26076160303219e-14],
-            [-9.301652644020242e-14, 40.71948719776858, 4.149879443489052e-14],
-            [5.311743673463141e-15, 2.041077680836527e-14, 25.237620491130023],
-        ]
+    @classmethod
+    def setUpClass(cls):
+        cls.module_path = os.path.dirname(os.path.abspath(__file__))
+        cls.EXAMPLE_DIR = os.path.join(cls.module_path, "../examples")
+        cls.CdTe_EXAMPLE_DIR = os.path.join(cls.module_path, "../examples/CdTe")
+        cls.CdTe_BULK_DATA_DIR = os.path.join(cls.CdTe_EXAMPLE_DIR, "CdTe_bulk/vasp_ncl")
+
+        # shared between tests, so made read-only to catch any accidental in-place modification:
+        cls.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
+        cls.CdTe_dielectric.flags.writeable = False
+
+        cls.YTOS_EXAMPLE_DIR = os.path.join(cls.module_path, "../examples/YTOS")
+        cls.ytos_dielectric = np.array(  # from legacy Materials Project
+            [
+                [40.71948719643814, -9.282128210266565e-14, 1.26076160303219e-14],
+                [-9.301652644020242e-14, 40.71948719776858, 4.149879443489052e-14],
+                [5.311743673463141e-15, 2.041077680836527e-14, 25.237620491130023],
+            ]
+        )
+        cls.ytos_dielectric.flags.writeable = False
 
-        self.Sb2Se3_DATA_DIR = os.path.join(self.module_path, "data/Sb2Se3")
-        self.Sb2Se3_dielectric = np.array([[85.64, 0, 0], [0.0, 128.18, 0], [0, 0, 15.00]])
+        cls.Sb2Se3_DATA_DIR = os.path.join(cls.module_path, "data/Sb2Se3")
+        cls.Sb2Se3_dielectric = np.array([[85.64, 0, 0], [0.0, 128.18, 0], [0, 0, 15.00]])
+        cls.Sb2Se3_dielectric.flags.writeable = False
 
-        self.Sb2Si2Te6_dielectric = [44.12, 44.12, 17.82]
-        self.Sb2Si2Te6_DATA_DIR = os.path.join(self.EXAMPLE_DIR, "Sb2Si2Te6")
+        cls.Sb2Si2Te6_dielectric = np.array([44.12, 44.12, 17.82])
+        cls.Sb2Si2Te6_dielectric.flags.writeable = False
+        cls.Sb2Si2Te6_DATA_DIR = os.path.join(cls.EXAMPLE_DIR, "Sb2Si2Te6")
 
-        self.V2O5_DATA_DIR = os.path.join(self.module_path, "data/V2O5")
-        self.SrTiO3_DATA_DIR = os.path.join(self.module_path, "data/SrTiO3")
+        cls.V2O5_DATA_DIR = os.path.join(cls.module_path, "data/V2O5")
+        cls.SrTiO3_DATA_DIR = os.path.join(cls.module_path, "data/SrTiO3")
 
     def tearDown(self):
         if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
@@ -80,7 +250,6 @@ class DefectsParsingTestCase(unittest.TestCase):
         if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Y2Ti2S2O5_defect_dict.json"))
         if_present_rm(os.path.join(self.Sb2Si2Te6_DATA_DIR, "SiSbTe3_defect_dict.json"))
         if_present_rm(os.path.join(self.Sb2Se3_DATA_DIR, "defect/Sb2Se3_defect_dict.json"))
-        if_present_rm("V2O5_test")
         if_present_rm(os.path.join(self.SrTiO3_DATA_DIR, "SrTiO3_defect_dict.json"))
 
     def _check_DefectsParser(self, dp, skip_corrections=False):
@@ -435,13 +604,7 @@ class DefectsParsingTestCase(unittest.TestCase):
         )
 
         for i in [
-            "An anisotropic dielectric constant was supplied, but `OUTCAR` files (needed to compute the "
-            "_anisotropic_ Kumagai eFNV charge correction) are missing from the defect or bulk folder.",
-            "`LOCPOT` files were found in both defect & bulk folders, and so the Freysoldt (FNV) "
-            "charge correction developed for _isotropic_ materials will be applied here, "
-            "which corresponds to using the effective isotropic average of the supplied "
-            "anisotropic dielectric. This could lead to significant errors for very anisotropic "
-            "systems and/or relatively small supercells!",
+            *_aniso_no_outcar_warning_parts,
             f"(using bulk path {self.CdTe_EXAMPLE_DIR}/CdTe_bulk/vasp_ncl and vasp_ncl defect "
             f"subfolders)",
         ]:
@@ -451,14 +614,7 @@ class DefectsParsingTestCase(unittest.TestCase):
             all(
                 i in str(warn.message)
                 for i in [
-                    "An anisotropic dielectric constant was supplied, but `OUTCAR` files (needed to "
-                    "compute the _anisotropic_ Kumagai eFNV charge correction) are missing from the "
-                    "defect or bulk folder.",
-                    "`LOCPOT` files were found in both defect & bulk folders, and so the Freysoldt (FNV) "
-                    "charge correction developed for _isotropic_ materials will be applied here, "
-                    "which corresponds to using the effective isotropic average of the supplied "
-                    "anisotropic dielectric. This could lead to significant errors for very anisotropic "
-                    "systems and/or relatively small supercells!",
+                    *_aniso_no_outcar_warning_parts,
                     f"(using bulk path {self.CdTe_EXAMPLE_DIR}/CdTe_bulk/vasp_ncl and vasp_ncl defect "
                     f"subfolders)",
                 ]
@@ -691,15 +847,18 @@ class DefectsParsingTestCase(unittest.TestCase):
 
     @custom_mpl_image_compare(filename="merged_renamed_v_O_plot.png")
     def test_V2O5_same_named_defects(self):
-        shutil.copytree(self.V2O5_DATA_DIR, "V2O5_test")
-        shutil.copytree("V2O5_test/v_O_1", "V2O5_test/unrecognised_4")
-        shutil.copytree("V2O5_test/v_O_1", "V2O5_test/unrecognised_5")
-        for i in os.listdir("V2O5_test"):
-            if os.path.isdir(f"V2O5_test/{i}") and i.startswith("v_O"):
-                shutil.move(f"V2O5_test/{i}", f"V2O5_test/unrecognised_{i[-1]}")
+        work_dir = tempfile.mkdtemp()  # per-test directory rather than CWD, for parallel test runs
+        self.addCleanup(shutil.rmtree, work_dir, ignore_errors=True)
+        V2O5_test_dir = os.path.join(work_dir, "V2O5_test")
+        shutil.copytree(self.V2O5_DATA_DIR, V2O5_test_dir)
+        shutil.copytree(f"{V2O5_test_dir}/v_O_1", f"{V2O5_test_dir}/unrecognised_4")
+        shutil.copytree(f"{V2O5_test_dir}/v_O_1", f"{V2O5_test_dir}/unrecognised_5")
+        for i in os.listdir(V2O5_test_dir):
+            if os.path.isdir(f"{V2O5_test_dir}/{i}") and i.startswith("v_O"):
+                shutil.move(f"{V2O5_test_dir}/{i}", f"{V2O5_test_dir}/unrecognised_{i[-1]}")
 
         with warnings.catch_warnings(record=True) as w:
-            dp = DefectsParser("V2O5_test", dielectric=[4.186, 19.33, 17.49])
+            dp = DefectsParser(V2O5_test_dir, dielectric=[4.186, 19.33, 17.49])
         print([str(warning.message) for warning in w])  # for debugging
         assert not w  # no warnings
         assert len(dp.defect_dict) == 5  # now 5 defects, all still included
@@ -762,85 +921,140 @@ class DefectsParsingTestCase(unittest.TestCase):
 
 
 class DopedParsingTestCase(unittest.TestCase):
-    def setUp(self):
-        self.module_path = os.path.dirname(os.path.abspath(__file__))
-        self.EXAMPLE_DIR = os.path.join(self.module_path, "../examples")
-        self.CdTe_EXAMPLE_DIR = os.path.join(self.module_path, "../examples/CdTe")
-        self.YTOS_EXAMPLE_DIR = os.path.join(self.module_path, "../examples/YTOS")
-        self.CdTe_BULK_DATA_DIR = os.path.join(self.CdTe_EXAMPLE_DIR, "CdTe_bulk/vasp_ncl")
-        self.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
-
-        self.ytos_dielectric = [  # from legacy Materials Project
-            [40.71948719643814, -9.282128210266565e-14, 1.26076160303219e-14],
-            [-9.301652644020242e-14, 40.71948719776858, 4.149879443489052e-14],
-            [5.311743673463141e-15, 2.041077680836527e-14, 25.237620491130023],
-        ]
+    @classmethod
+    def setUpClass(cls):
+        cls._set_up_examples()
+
+        # reference v_Cd_-2 entries (with auto-determined and explicit charge states), parsed once from
+        # the example folders and shared between tests as copies (see ``_parse_v_Cd_m2``):
+        cls._parsed_v_Cd_m2_entries = {
+            charge_state: defect_entry_from_paths(
+                defect_path=os.path.join(cls.EXAMPLE_DIR, "CdTe/v_Cd_-2/vasp_ncl"),
+                bulk_path=os.path.join(cls.EXAMPLE_DIR, "CdTe/CdTe_bulk/vasp_ncl"),
+                dielectric=cls.CdTe_dielectric,
+                charge_state=charge_state,
+            )
+            for charge_state in [None, -2]
+        }
 
-        self.Sb2Se3_DATA_DIR = os.path.join(self.module_path, "data/Sb2Se3")
-        self.Sb2Se3_dielectric = np.array([[85.64, 0, 0], [0.0, 128.18, 0], [0, 0, 15.00]])
+        # bulk LOCPOT and OUTCAR data, parsed once to pass to ``defect_entry_from_paths`` in tests which
+        # parse multiple defects with the same bulk (as done in ``DefectsParser``); other tests parse the
+        # bulk files directly:
+        CdTe_bulk_path = os.path.join(cls.EXAMPLE_DIR, "CdTe/CdTe_bulk/vasp_ncl")
+        cls.CdTe_bulk_data_kwargs = {
+            "bulk_locpot_dict": _get_bulk_locpot_dict(CdTe_bulk_path),
+            "bulk_site_potentials": _get_bulk_site_potentials(CdTe_bulk_path),
+        }
 
-    def tearDown(self):
-        if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
+    @classmethod
+    def _set_up_examples(cls):
+        """
+        Set the example folder paths, dielectrics and other class attributes
+        shared between tests (also used by ``DopedParsingFunctionsTestCase``).
+        """
+        cls.module_path = os.path.dirname(os.path.abspath(__file__))
+        cls.EXAMPLE_DIR = os.path.join(cls.module_path, "../examples")
+        cls.CdTe_EXAMPLE_DIR = os.path.join(cls.EXAMPLE_DIR, "CdTe")
+        cls.YTOS_EXAMPLE_DIR = os.path.join(cls.EXAMPLE_DIR, "YTOS")
+        # frequently-used defect folders (only read, tests which modify these use linked copies, see
+        # ``_link_example_folder``):
+        cls.v_Cd_m2_DIR = f"{cls.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
+        cls.Int_Te_3_2_DIR = f"{cls.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl"
+        cls.F_O_1_DIR = f"{cls.YTOS_EXAMPLE_DIR}/F_O_1"
+
+        # shared between tests, so made read-only to catch any accidental in-place modification:
+        cls.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
+        cls.CdTe_dielectric.flags.writeable = False
+
+        cls.ytos_dielectric = np.array(  # from legacy Materials Project
+            [
+                [40.71948719643814, -9.282128210266565e-14, 1.26076160303219e-14],
+                [-9.301652644020242e-14, 40.71948719776858, 4.149879443489052e-14],
+                [5.311743673463141e-15, 2.041077680836527e-14, 25.237620491130023],
+            ]
+        )
+        cls.ytos_dielectric.flags.writeable = False
 
-        if os.path.exists(f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/hidden_otcr.gz"):
-            shutil.move(
-                f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/hidden_otcr.gz",
-                f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/OUTCAR.gz",
-            )
+        cls.Sb2Se3_DATA_DIR = os.path.join(cls.module_path, "data/Sb2Se3")
+        cls.Sb2Se3_dielectric = np.array([[85.64, 0, 0], [0.0, 128.18, 0], [0, 0, 15.00]])
+        cls.Sb2Se3_dielectric.flags.writeable = False
 
-        if os.path.exists(f"{self.YTOS_EXAMPLE_DIR}/F_O_1/hidden_otcr.gz"):
-            shutil.move(
-                f"{self.YTOS_EXAMPLE_DIR}/F_O_1/hidden_otcr.gz",
-                f"{self.YTOS_EXAMPLE_DIR}/F_O_1/OUTCAR.gz",
-            )
+        # list the CdTe example defect folders once, for the tests which loop over them:
+        CdTe_example_folders = sorted(
+            entry.name for entry in os.scandir(os.path.join(cls.EXAMPLE_DIR, "CdTe")) if entry.is_dir()
+        )
+        cls.CdTe_v_Cd_folders = [
+            folder
+            for folder in CdTe_example_folders
+            if _v_Cd_charge_regex.match(folder)
+            and os.path.isdir(os.path.join(cls.EXAMPLE_DIR, "CdTe", folder, "vasp_ncl"))
+        ]
+        cls.CdTe_Te_Cd_folder_charges = {  # {folder: charge state}
+            folder: int(_folder_charge_regex.search(folder).group(1))
+            for folder in CdTe_example_folders
+            if "Te_Cd" in folder
+        }
+        cls.CdTe_Int_Te_folders = [folder for folder in CdTe_example_folders if "Int_Te" in folder]
+
+        # the bulk Voronoi nodes are expensive to compute, so compute once here and write to the bulk
+        # folders in ``setUp`` (in the same format as the ``voronoi_nodes.json`` files written by doped):
+        cls._bulk_voronoi_node_dicts = {}  # {bulk folder relative to the examples folder: dict}
+        for bulk_dir in ["CdTe/CdTe_bulk/vasp_ncl", "YTOS/Bulk"]:
+            bulk_supercell = get_vasprun(
+                os.path.join(cls.EXAMPLE_DIR, bulk_dir, "vasprun.xml.gz"), parse_dos=False
+            ).final_structure
+            cls._bulk_voronoi_node_dicts[bulk_dir] = {
+                "bulk_supercell": bulk_supercell,
+                "Voronoi nodes": [site.frac_coords for site in _get_voronoi_nodes(bulk_supercell)],
+            }
 
-        if_present_rm(f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/another_LOCPOT.gz")
-        if_present_rm(f"{self.CdTe_BULK_DATA_DIR}/another_LOCPOT.gz")
-        if_present_rm(f"{self.CdTe_BULK_DATA_DIR}/another_OUTCAR.gz")
-        if_present_rm(f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/another_vasprun.xml.gz")
-        if_present_rm(f"{self.CdTe_BULK_DATA_DIR}/another_vasprun.xml.gz")
+    def setUp(self):
+        # doped writes ``voronoi_nodes.json`` to the bulk folders when parsing, and some tests add or
+        # remove files in these, so each test uses linked copies of the bulk folders in a temporary
+        # directory (removed again in ``tearDown``):
+        self._stack = contextlib.ExitStack()
+        self._work_dir = self._stack.enter_context(tempfile.TemporaryDirectory())
+        self.CdTe_BULK_DATA_DIR = self._link_example_folder("CdTe/CdTe_bulk/vasp_ncl")
+        self.YTOS_BULK_DATA_DIR = self._link_example_folder("YTOS/Bulk")
+        for bulk_dir, bulk_voronoi_node_dict in self._bulk_voronoi_node_dicts.items():
+            dumpfn(bulk_voronoi_node_dict, os.path.join(self._work_dir, bulk_dir, "voronoi_nodes.json"))
 
-        if os.path.exists(f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/hidden_lcpt.gz"):
-            shutil.move(
-                f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/hidden_lcpt.gz",
-                f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/LOCPOT.gz",
-            )
+    def tearDown(self):
+        self._stack.close()
 
-        if_present_rm(f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/LOCPOT.gz")
+    def _link_example_folder(self, folder):
+        """
+        Link the example ``folder`` (relative to ``EXAMPLE_DIR``) into the
+        temporary directory for this test (see ``_link_fixture_tree``), for tests
+        which add, move or remove files in it, and return its path.
+        """
+        return _link_fixture_tree(
+            os.path.join(self.EXAMPLE_DIR, folder), os.path.join(self._work_dir, folder)
+        )
 
     def test_auto_charge_determination(self):
         """
         Test that the defect charge is correctly auto-determined.
         """
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
+        defect_path = self.v_Cd_m2_DIR
 
         parsed_v_cd_m2 = defect_entry_from_paths(
             defect_path=defect_path,
             bulk_path=self.CdTe_BULK_DATA_DIR,
             dielectric=self.CdTe_dielectric,
+            vasprun_kwargs={"parse_dos": True},  # test full vasprun parsing (default), with DOS
         )
 
-        parsed_v_cd_m2_explicit_charge = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=self.CdTe_dielectric,
-            charge_state=-2,
-        )
+        parsed_v_cd_m2_explicit_charge = self._parse_v_Cd_m2(charge_state=-2)
         assert parsed_v_cd_m2.get_ediff() == parsed_v_cd_m2_explicit_charge.get_ediff()
         assert parsed_v_cd_m2.charge_state == -2
         assert parsed_v_cd_m2_explicit_charge.charge_state == -2
 
         # Check that the correct Freysoldt correction is applied
-        correct_correction_dict = {
-            "freysoldt_charge_correction": 0.7376460317828045,
-        }
-        for correction_name, correction_energy in correct_correction_dict.items():
-            for defect_entry in [parsed_v_cd_m2, parsed_v_cd_m2_explicit_charge]:
-                assert np.isclose(
-                    defect_entry.corrections[correction_name],
-                    correction_energy,
-                    atol=1e-3,
-                )
+        for defect_entry in [parsed_v_cd_m2, parsed_v_cd_m2_explicit_charge]:
+            assert math.isclose(
+                defect_entry.corrections["freysoldt_charge_correction"], 0.7376460317828045, abs_tol=1e-3
+            )
 
         # test warning when specifying the wrong charge:
         with warnings.catch_warnings(record=True) as w:
@@ -856,36 +1070,36 @@ class DopedParsingTestCase(unittest.TestCase):
                 "Auto-determined defect charge q=-2 does not match specified charge q=-1. Will continue "
                 "with specified charge_state, but beware!" in str(w[-1].message)
             )
-            assert np.isclose(
-                parsed_v_cd_m1.corrections["freysoldt_charge_correction"], 0.26066457692529815
+            assert math.isclose(
+                parsed_v_cd_m1.corrections["freysoldt_charge_correction"],
+                0.26066457692529815,
+                rel_tol=1e-5,
             )
 
         # test YTOS, has trickier POTCAR symbols with  Y_sv, Ti, S, O
         ytos_F_O_1 = defect_entry_from_paths(
-            f"{self.YTOS_EXAMPLE_DIR}/F_O_1",
-            f"{self.YTOS_EXAMPLE_DIR}/Bulk",
+            self.F_O_1_DIR,
+            self.YTOS_BULK_DATA_DIR,
             self.ytos_dielectric,
             skip_corrections=True,
         )
         assert ytos_F_O_1.charge_state == 1
-        assert np.isclose(ytos_F_O_1.get_ediff(), -0.0852, atol=1e-3)  # uncorrected energy
+        assert math.isclose(ytos_F_O_1.get_ediff(), -0.0852, abs_tol=1e-3)  # uncorrected energy
 
         ytos_F_O_1 = defect_entry_from_paths(  # with corrections this time
-            f"{self.YTOS_EXAMPLE_DIR}/F_O_1",
-            f"{self.YTOS_EXAMPLE_DIR}/Bulk",
-            self.ytos_dielectric,
+            self.F_O_1_DIR,
+            self.YTOS_BULK_DATA_DIR,
+            self.ytos_dielectric.tolist(),  # also test list input for dielectric
+        )
+        assert math.isclose(ytos_F_O_1.get_ediff(), 0.04176070572680146, abs_tol=1e-3)  # corrected energy
+        assert math.isclose(
+            ytos_F_O_1.corrections["kumagai_charge_correction"], 0.12699488572686776, abs_tol=1e-3
         )
-        assert np.isclose(ytos_F_O_1.get_ediff(), 0.04176070572680146, atol=1e-3)  # corrected energy
-        correction_dict = {
-            "kumagai_charge_correction": 0.12699488572686776,
-        }
-        for correction_name, correction_energy in correction_dict.items():
-            assert np.isclose(ytos_F_O_1.corrections[correction_name], correction_energy, atol=1e-3)
         # assert auto-determined interstitial site is correct
-        assert np.isclose(
-            ytos_F_O_1.defect_supercell_site.distance_and_image_from_frac_coords([0, 0, 0])[0],
+        assert math.isclose(
+            _mic_distance(ytos_F_O_1.defect_supercell_site, [0, 0, 0]),
             0.0,
-            atol=1e-2,
+            abs_tol=1e-2,
         )
 
     def test_auto_charge_correction_behaviour(self):
@@ -895,49 +1109,45 @@ class DopedParsingTestCase(unittest.TestCase):
         Here we have mixed and matched `defect_entry_from_paths` and
         `DefectParser.from_paths()` as the results should be the same.
         """
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
+        # files are moved, added and removed in these defect folders, so use linked copies:
+        defect_path = self._link_example_folder("CdTe/v_Cd_-2/vasp_ncl")
+        int_te_3_2_path = self._link_example_folder("CdTe/Int_Te_3_2/vasp_ncl")
         fake_aniso_dielectric = [1, 2, 3]
 
-        with warnings.catch_warnings(record=True) as w:
+        with warnings.catch_warnings(record=True) as w:  # cleared between sub-cases
+            warnings.simplefilter("always")  # record repeated warnings in each sub-case
             parsed_v_cd_m2_fake_aniso_dp = DefectParser.from_paths(
                 defect_path=defect_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=fake_aniso_dielectric,
             )
-        print([str(warn.message) for warn in w])  # for debugging
-        assert len(w) == 1
-        assert issubclass(w[-1].category, UserWarning)
-        assert (
-            "An anisotropic dielectric constant was supplied, but `OUTCAR` files (needed to compute "
-            "the _anisotropic_ Kumagai eFNV charge correction) are missing from the defect or bulk "
-            "folder.\n`LOCPOT` files were found in both defect & bulk folders, and so the "
-            "Freysoldt (FNV) charge correction developed for _isotropic_ materials will be applied "
-            "here, which corresponds to using the effective isotropic average of the supplied "
-            "anisotropic dielectric. This could lead to significant errors for very anisotropic "
-            "systems and/or relatively small supercells!" in str(w[-1].message)
-        )
-        assert all(
-            i in parsed_v_cd_m2_fake_aniso_dp.__repr__()
-            for i in [
-                "doped DefectParser for bulk composition CdTe. ",
-                "Available attributes",
-                "defect_entry",
-                "error_tolerance",
-                "Available methods",
-                "load_eFNV_data",
-            ]
-        )
-        parsed_v_cd_m2_fake_aniso = parsed_v_cd_m2_fake_aniso_dp.defect_entry
+            print([str(warn.message) for warn in w])  # for debugging
+            assert len(w) == 1
+            assert issubclass(w[-1].category, UserWarning)
+            assert _aniso_no_outcar_warning in str(w[-1].message)
+            assert all(
+                i in parsed_v_cd_m2_fake_aniso_dp.__repr__()
+                for i in [
+                    "doped DefectParser for bulk composition CdTe. ",
+                    "Available attributes",
+                    "defect_entry",
+                    "error_tolerance",
+                    "Available methods",
+                    "load_eFNV_data",
+                ]
+            )
+            parsed_v_cd_m2_fake_aniso = parsed_v_cd_m2_fake_aniso_dp.defect_entry
 
-        assert np.isclose(
-            parsed_v_cd_m2_fake_aniso.get_ediff() - sum(parsed_v_cd_m2_fake_aniso.corrections.values()),
-            7.661,
-            atol=3e-3,
-        )  # uncorrected energy
-        assert np.isclose(parsed_v_cd_m2_fake_aniso.get_ediff(), 10.379714081555262, atol=1e-3)
+            assert math.isclose(
+                parsed_v_cd_m2_fake_aniso.get_ediff()
+                - sum(parsed_v_cd_m2_fake_aniso.corrections.values()),
+                7.661,
+                abs_tol=3e-3,
+            )  # uncorrected energy
+            assert math.isclose(parsed_v_cd_m2_fake_aniso.get_ediff(), 10.379714081555262, abs_tol=1e-3)
 
-        # test no warnings when skip_corrections is True
-        with warnings.catch_warnings(record=True) as w:
+            # test no warnings when skip_corrections is True
+            w.clear()
             parsed_v_cd_m2_fake_aniso = defect_entry_from_paths(
                 defect_path=defect_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
@@ -947,27 +1157,24 @@ class DopedParsingTestCase(unittest.TestCase):
             )
             assert len(w) == 0
 
-        assert np.isclose(
-            parsed_v_cd_m2_fake_aniso.get_ediff() - sum(parsed_v_cd_m2_fake_aniso.corrections.values()),
-            7.661,
-            atol=3e-3,
-        )  # uncorrected energy
-        assert np.isclose(parsed_v_cd_m2_fake_aniso.get_ediff(), 7.661, atol=1e-3)
-        assert parsed_v_cd_m2_fake_aniso.corrections == {}
-
-        # test fake anisotropic dielectric with Int_Te_3_2, which has multiple OUTCARs:
-        with warnings.catch_warnings(record=True) as w:
+            assert math.isclose(
+                parsed_v_cd_m2_fake_aniso.get_ediff()
+                - sum(parsed_v_cd_m2_fake_aniso.corrections.values()),
+                7.661,
+                abs_tol=3e-3,
+            )  # uncorrected energy
+            assert math.isclose(parsed_v_cd_m2_fake_aniso.get_ediff(), 7.661, abs_tol=1e-3)
+            assert parsed_v_cd_m2_fake_aniso.corrections == {}
+
+            # test fake anisotropic dielectric with Int_Te_3_2, which has multiple OUTCARs:
+            w.clear()
             parsed_int_Te_2_fake_aniso = DefectParser.from_paths(
-                defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
+                defect_path=int_te_3_2_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=fake_aniso_dielectric,
                 charge_state=2,  # test manually specifying charge state
             ).defect_entry
-            assert (
-                f"Multiple `OUTCAR` files found in defect directory: "
-                f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl. Using OUTCAR.gz to parse core levels and "
-                f"compute the Kumagai (eFNV) image charge correction." in str(w[0].message)
-            )
+            assert _multiple_files_warning("OUTCAR", "defect", int_te_3_2_path) in str(w[0].message)
             assert (
                 f"Estimated error in the Kumagai (eFNV) charge correction for defect "
                 f"{parsed_int_Te_2_fake_aniso.name} is 0.157 eV (i.e. which is greater than the "
@@ -979,88 +1186,83 @@ class DopedParsingTestCase(unittest.TestCase):
                 f"supercell for more accurate energies." in str(w[1].message)
             )
 
-        assert np.isclose(
-            parsed_int_Te_2_fake_aniso.get_ediff() - sum(parsed_int_Te_2_fake_aniso.corrections.values()),
-            -7.105,
-            atol=3e-3,
-        )  # uncorrected energy
-        assert np.isclose(parsed_int_Te_2_fake_aniso.get_ediff(), -4.991240009587045, atol=1e-3)
+            assert math.isclose(
+                parsed_int_Te_2_fake_aniso.get_ediff()
+                - sum(parsed_int_Te_2_fake_aniso.corrections.values()),
+                -7.105,
+                abs_tol=3e-3,
+            )  # uncorrected energy
+            assert math.isclose(parsed_int_Te_2_fake_aniso.get_ediff(), -4.991240009587045, abs_tol=1e-3)
 
-        # test isotropic dielectric but only OUTCAR present:
-        with warnings.catch_warnings(record=True) as w:
+            # test isotropic dielectric but only OUTCAR present:
+            w.clear()
             parsed_int_Te_2 = defect_entry_from_paths(
-                defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
+                defect_path=int_te_3_2_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=self.CdTe_dielectric,
                 charge_state=2,
             )
-        assert len(w) == 1  # no charge correction warning with iso dielectric, parsing from OUTCARs,
-        # but multiple OUTCARs present -> warning
-        assert np.isclose(parsed_int_Te_2.get_ediff(), -6.2009, atol=1e-3)
+            assert len(w) == 1  # no charge correction warning with iso dielectric, parsing from OUTCARs,
+            # but multiple OUTCARs present -> warning
+            assert math.isclose(parsed_int_Te_2.get_ediff(), -6.2009, abs_tol=1e-3)
 
-        # test warning when only OUTCAR present but no core level info (ICORELEVEL != 0)
-        shutil.move(
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/OUTCAR.gz",
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/hidden_otcr.gz",
-        )
+            # test warning when only OUTCAR present but no core level info (ICORELEVEL != 0)
+            shutil.move(
+                f"{int_te_3_2_path}/OUTCAR.gz",
+                f"{int_te_3_2_path}/hidden_otcr.gz",
+            )
 
-        with warnings.catch_warnings(record=True) as w:
-            parsed_int_Te_2_fake_aniso = self._check_no_icorelevel_warning_int_te(
-                fake_aniso_dielectric,
+            w.clear()
+            parsed_int_Te_2_fake_aniso = defect_entry_from_paths(
+                defect_path=int_te_3_2_path,
+                bulk_path=self.CdTe_BULK_DATA_DIR,
+                dielectric=fake_aniso_dielectric,
+                charge_state=2,
+            )
+            self._check_no_icorelevel_warning_int_te(
+                parsed_int_Te_2_fake_aniso,
+                int_te_3_2_path,
                 w,
                 1,
                 "-> Charge corrections will not be applied for this defect.",
             )
-        assert np.isclose(
-            parsed_int_Te_2_fake_aniso.get_ediff() - sum(parsed_int_Te_2_fake_aniso.corrections.values()),
-            -7.105,
-            atol=3e-3,
-        )  # uncorrected energy
-        assert np.isclose(parsed_int_Te_2_fake_aniso.get_ediff(), -7.105, atol=1e-3)
-
-        # test warning when no core level info in OUTCAR (ICORELEVEL != 0), but LOCPOT
-        # files present, but anisotropic dielectric:
-        shutil.copyfile(
-            f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl/LOCPOT.gz",
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/LOCPOT.gz",
-        )
+            assert math.isclose(parsed_int_Te_2_fake_aniso.get_ediff(), -7.105, abs_tol=1e-3)
 
-        with warnings.catch_warnings(record=True) as w:
-            parsed_int_Te_2_fake_aniso = self._check_no_icorelevel_warning_int_te(
-                fake_aniso_dielectric,
-                w,
-                2,
-                "`LOCPOT` files were found in both defect & bulk folders, and so the Freysoldt (FNV) "
-                "charge correction developed for _isotropic_ materials will be applied here, "
-                "which corresponds to using the effective isotropic average of the supplied anisotropic "
-                "dielectric. This could lead to significant errors for very anisotropic systems and/or "
-                "relatively small supercells!",
+            # test warning when no core level info in OUTCAR (ICORELEVEL != 0), but LOCPOT
+            # files present, but anisotropic dielectric:
+            _fixture_link(
+                f"{defect_path}/LOCPOT.gz",
+                f"{int_te_3_2_path}/LOCPOT.gz",
             )
 
-        assert np.isclose(
-            parsed_int_Te_2_fake_aniso.get_ediff() - sum(parsed_int_Te_2_fake_aniso.corrections.values()),
-            -7.105,
-            atol=3e-3,
-        )  # uncorrected energy
-        assert np.isclose(
-            parsed_int_Te_2_fake_aniso.get_ediff(), -4.7620, atol=1e-3
-        )  # -4.734 with old voronoi frac coords
+            w.clear()
+            parsed_int_Te_2_fake_aniso = defect_entry_from_paths(
+                defect_path=int_te_3_2_path,
+                bulk_path=self.CdTe_BULK_DATA_DIR,
+                dielectric=fake_aniso_dielectric,
+                charge_state=2,
+            )
+            self._check_no_icorelevel_warning_int_te(
+                parsed_int_Te_2_fake_aniso, int_te_3_2_path, w, 2, _aniso_no_outcar_warning_parts[1]
+            )
+            assert math.isclose(
+                parsed_int_Te_2_fake_aniso.get_ediff(), -4.7620, abs_tol=1e-3
+            )  # -4.734 with old voronoi frac coords
 
-        if_present_rm(f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/LOCPOT.gz")
+            if_present_rm(f"{int_te_3_2_path}/LOCPOT.gz")
 
-        # rename files back to original:
-        shutil.move(
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/hidden_otcr.gz",
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/OUTCAR.gz",
-        )
+            # rename files back to original:
+            shutil.move(
+                f"{int_te_3_2_path}/hidden_otcr.gz",
+                f"{int_te_3_2_path}/OUTCAR.gz",
+            )
 
-        # test warning when no OUTCAR or LOCPOT file found:
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
-        shutil.move(
-            f"{defect_path}/LOCPOT.gz",
-            f"{defect_path}/hidden_lcpt.gz",
-        )
-        with warnings.catch_warnings(record=True) as w:
+            # test warning when no OUTCAR or LOCPOT file found:
+            shutil.move(
+                f"{defect_path}/LOCPOT.gz",
+                f"{defect_path}/hidden_lcpt.gz",
+            )
+            w.clear()
             parsed_v_cd_m2 = DefectParser.from_paths(
                 defect_path=defect_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
@@ -1074,19 +1276,19 @@ class DopedParsingTestCase(unittest.TestCase):
                 "for this defect." in str(w[0].message)
             )
 
-        assert np.isclose(
-            parsed_v_cd_m2.get_ediff() - sum(parsed_v_cd_m2.corrections.values()), 7.661, atol=3e-3
-        )  # uncorrected energy
-        assert np.isclose(parsed_v_cd_m2.get_ediff(), 7.661, atol=1e-3)
-        assert parsed_v_cd_m2.corrections == {}
+            assert math.isclose(
+                parsed_v_cd_m2.get_ediff() - sum(parsed_v_cd_m2.corrections.values()), 7.661, abs_tol=3e-3
+            )  # uncorrected energy
+            assert math.isclose(parsed_v_cd_m2.get_ediff(), 7.661, abs_tol=1e-3)
+            assert parsed_v_cd_m2.corrections == {}
 
-        # move LOCPOT back to original:
-        shutil.move(f"{defect_path}/hidden_lcpt.gz", f"{defect_path}/LOCPOT.gz")
+            # move LOCPOT back to original:
+            shutil.move(f"{defect_path}/hidden_lcpt.gz", f"{defect_path}/LOCPOT.gz")
 
-        # test no warning when no OUTCAR or LOCPOT file found, but charge is zero:
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_0/vasp_ncl"  # no LOCPOT/OUTCAR
+            # test no warning when no OUTCAR or LOCPOT file found, but charge is zero:
+            defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_0/vasp_ncl"  # no LOCPOT/OUTCAR
 
-        with warnings.catch_warnings(record=True) as w:
+            w.clear()
             parsed_v_cd_0 = defect_entry_from_paths(
                 defect_path=defect_path,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
@@ -1094,35 +1296,37 @@ class DopedParsingTestCase(unittest.TestCase):
             )
             assert len(w) == 0
 
-        assert np.isclose(
-            parsed_v_cd_0.get_ediff() - sum(parsed_v_cd_0.corrections.values()), 4.166, atol=3e-3
-        )  # uncorrected energy
-        assert np.isclose(parsed_v_cd_0.get_ediff(), 4.166, atol=1e-3)
+            assert math.isclose(
+                parsed_v_cd_0.get_ediff() - sum(parsed_v_cd_0.corrections.values()), 4.166, abs_tol=3e-3
+            )  # uncorrected energy
+            assert math.isclose(parsed_v_cd_0.get_ediff(), 4.166, abs_tol=1e-3)
 
-    def _check_no_icorelevel_warning_int_te(self, dielectric, warnings, num_warnings, action):
+    def _check_no_icorelevel_warning_int_te(
+        self, parsed_entry, defect_path, warnings, num_warnings, action
+    ):
+        """
+        Check the warnings (and uncorrected energy) from parsing ``Int_Te_3_2``
+        (in ``defect_path``) with the ``OUTCAR`` without core level info
+        (ICORELEVEL != 0).
+        """
         print(
-            f"Running _check_no_icorelevel_warning_int_te with dielectric {dielectric}, expecting "
-            f"{num_warnings} warnings and action: {action}"
+            f"Running _check_no_icorelevel_warning_int_te, expecting {num_warnings} warnings and "
+            f"action: {action}"
         )  # for debugging
-        result = defect_entry_from_paths(
-            defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=dielectric,
-            charge_state=2,
-        )
         print([warn.message for warn in warnings])  # for debugging
         assert len(warnings) == num_warnings
         assert all(issubclass(warning.category, UserWarning) for warning in warnings)
         assert (  # different warning start depending on whether isotropic or anisotropic dielectric
             f"in the defect or bulk folder were unable to be parsed, giving the following error message:\n"
             f"Unable to parse atomic core potentials from defect `OUTCAR` at "
-            f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl/OUTCAR_no_core_levels.gz. This can happen if "
+            f"{defect_path}/OUTCAR_no_core_levels.gz. This can happen if "
             f"`ICORELEVEL` was not set to 0 (= default) in the `INCAR`, or if the calculation was "
             f"finished prematurely with a `STOPCAR`. The Kumagai charge correction cannot be computed "
             f"without this data!\n{action}" in str(warnings[0].message)
         )
-
-        return result
+        assert math.isclose(
+            parsed_entry.get_ediff() - sum(parsed_entry.corrections.values()), -7.105, abs_tol=3e-3
+        )  # uncorrected energy
 
     def _parse_Int_Te_3_2_and_count_warnings(self, fake_aniso_dielectric, w, num_warnings):
         print(
@@ -1130,7 +1334,7 @@ class DopedParsingTestCase(unittest.TestCase):
             f"expecting {num_warnings} warnings"
         )  # for debugging
         defect_entry_from_paths(
-            defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
+            defect_path=self.Int_Te_3_2_DIR,
             bulk_path=self.CdTe_BULK_DATA_DIR,
             dielectric=fake_aniso_dielectric,
             charge_state=2,
@@ -1140,34 +1344,25 @@ class DopedParsingTestCase(unittest.TestCase):
         assert all(issubclass(warning.category, UserWarning) for warning in w)
 
     def test_multiple_outcars(self):
-        shutil.copyfile(
+        _fixture_link(
             f"{self.CdTe_BULK_DATA_DIR}/OUTCAR.gz",
             f"{self.CdTe_BULK_DATA_DIR}/another_OUTCAR.gz",
         )
         fake_aniso_dielectric = [1, 2, 3]
         with warnings.catch_warnings(record=True) as w:
             self._parse_Int_Te_3_2_and_count_warnings(fake_aniso_dielectric, w, 3)
-            assert (
-                f"Multiple `OUTCAR` files found in bulk directory: {self.CdTe_BULK_DATA_DIR}. Using "
-                f"OUTCAR.gz to parse core levels and compute the Kumagai (eFNV) image charge "
-                f"correction." in str(w[0].message)
-            )
-            assert (
-                f"Multiple `OUTCAR` files found in defect directory: "
-                f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl. Using "
-                f"OUTCAR.gz to parse core levels and compute the Kumagai (eFNV) image charge "
-                f"correction." in str(w[1].message)
-            )
+            assert _multiple_files_warning("OUTCAR", "bulk", self.CdTe_BULK_DATA_DIR) in str(w[0].message)
+            assert _multiple_files_warning("OUTCAR", "defect", self.Int_Te_3_2_DIR) in str(w[1].message)
             # other warnings is charge correction error warning, already tested
 
         with warnings.catch_warnings(record=True) as w:
             self._parse_Int_Te_3_2_and_count_warnings(fake_aniso_dielectric, w, 3)
 
     def test_multiple_locpots(self):
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
+        defect_path = self._link_example_folder("CdTe/v_Cd_-2/vasp_ncl")  # files added, so use linked copy
 
-        shutil.copyfile(f"{defect_path}/LOCPOT.gz", f"{defect_path}/another_LOCPOT.gz")
-        shutil.copyfile(
+        _fixture_link(f"{defect_path}/LOCPOT.gz", f"{defect_path}/another_LOCPOT.gz")
+        _fixture_link(
             f"{self.CdTe_BULK_DATA_DIR}/LOCPOT.gz",
             f"{self.CdTe_BULK_DATA_DIR}/another_LOCPOT.gz",
         )
@@ -1181,22 +1376,14 @@ class DopedParsingTestCase(unittest.TestCase):
             )
             assert len(w) == 2  # multiple LOCPOTs (both defect and bulk)
             assert all(issubclass(warning.category, UserWarning) for warning in w)
-            assert (
-                f"Multiple `LOCPOT` files found in bulk directory: {self.CdTe_BULK_DATA_DIR}. Using "
-                f"LOCPOT.gz to parse the electrostatic potential and compute the Freysoldt (FNV) charge "
-                f"correction." in str(w[0].message)
-            )
-            assert (
-                f"Multiple `LOCPOT` files found in defect directory: {defect_path}. Using LOCPOT.gz to "
-                f"parse the electrostatic potential and compute the Freysoldt (FNV) charge correction."
-                in str(w[1].message)
-            )
+            assert _multiple_files_warning("LOCPOT", "bulk", self.CdTe_BULK_DATA_DIR) in str(w[0].message)
+            assert _multiple_files_warning("LOCPOT", "defect", defect_path) in str(w[1].message)
 
     def test_multiple_vaspruns(self):
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
+        defect_path = self._link_example_folder("CdTe/v_Cd_-2/vasp_ncl")  # files added, so use linked copy
 
-        shutil.copyfile(f"{defect_path}/vasprun.xml.gz", f"{defect_path}/another_vasprun.xml.gz")
-        shutil.copyfile(
+        _fixture_link(f"{defect_path}/vasprun.xml.gz", f"{defect_path}/another_vasprun.xml.gz")
+        _fixture_link(
             f"{self.CdTe_BULK_DATA_DIR}/vasprun.xml.gz",
             f"{self.CdTe_BULK_DATA_DIR}/another_vasprun.xml.gz",
         )
@@ -1210,181 +1397,100 @@ class DopedParsingTestCase(unittest.TestCase):
             )
             assert len(w) == 2  # multiple `vasprun.xml`s (both defect and bulk)
             assert all(issubclass(warning.category, UserWarning) for warning in w)
-            assert (
-                f"Multiple `vasprun.xml` files found in bulk directory: {self.CdTe_BULK_DATA_DIR}. Using "
-                f"vasprun.xml.gz to parse the calculation energy and metadata." in str(w[0].message)
-            )
-            assert (
-                f"Multiple `vasprun.xml` files found in defect directory: {defect_path}. Using "
-                f"vasprun.xml.gz to parse the calculation energy and metadata." in str(w[1].message)
+            assert _multiple_files_warning("vasprun.xml", "bulk", self.CdTe_BULK_DATA_DIR) in str(
+                w[0].message
             )
+            assert _multiple_files_warning("vasprun.xml", "defect", defect_path) in str(w[1].message)
+
+    def _parse_v_Cd_m2(self, charge_state=None):
+        """
+        Get a copy of the reference CdTe ``v_Cd_-2`` ``DefectEntry`` (parsed with
+        the CdTe dielectric in ``setUpClass``), as it is used as the reference
+        entry in multiple tests.
+        """
+        return copy.deepcopy(self._parsed_v_Cd_m2_entries[charge_state])
 
     def test_dielectric_initialisation(self):
         """
         Test that dielectric can be supplied as float or int or 3x1 array/list
         or 3x3 array/list.
         """
-        defect_path = f"{self.CdTe_EXAMPLE_DIR}/v_Cd_-2/vasp_ncl"
         # get correct Freysoldt correction energy:
-        parsed_v_cd_m2 = defect_entry_from_paths(  # defect charge determined automatically
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=self.CdTe_dielectric,
-            charge_state=-2,
-        )
+        parsed_v_cd_m2 = self._parse_v_Cd_m2(charge_state=-2)
 
         # Check that the correct Freysoldt correction is applied
-        correct_correction_dict = {
-            "freysoldt_charge_correction": 0.7376460317828045,
-        }
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
-
-        # test float
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=9.13,
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
-
-        # test int
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=9,
-            charge_state=-2,
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=0.1,  # now slightly off because using int()
-            )
-
-        # test 3x1 array
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=np.array([9.13, 9.13, 9.13]),
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
-
-        # test 3x1 list
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=[9.13, 9.13, 9.13],
-            charge_state=-2,
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
-
-        # test 3x3 array
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=self.CdTe_dielectric,
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
-
-        # test 3x3 list
-        new_parsed_v_cd_m2 = defect_entry_from_paths(
-            defect_path=defect_path,
-            bulk_path=self.CdTe_BULK_DATA_DIR,
-            dielectric=self.CdTe_dielectric.tolist(),
-            charge_state=-2,
-        )
-        for correction_name, correction_energy in correct_correction_dict.items():
-            assert np.isclose(
-                new_parsed_v_cd_m2.corrections[correction_name],
-                correction_energy,
-                atol=1e-3,
-            )
+        correct_freysoldt_correction = 0.7376460317828045
+        assert math.isclose(
+            parsed_v_cd_m2.corrections["freysoldt_charge_correction"],
+            correct_freysoldt_correction,
+            abs_tol=1e-3,
+        )
+
+        for dielectric_type, dielectric, charge_state, atol in [
+            ("float", 9.13, None, 1e-3),
+            ("int", 9, -2, 0.1),  # now slightly off because using int()
+            ("3x1 array", np.array([9.13, 9.13, 9.13]), None, 1e-3),
+            ("3x1 list", [9.13, 9.13, 9.13], -2, 1e-3),
+            ("3x3 array", self.CdTe_dielectric, None, 1e-3),
+            ("3x3 list", self.CdTe_dielectric.tolist(), -2, 1e-3),
+        ]:
+            with self.subTest(dielectric_type=dielectric_type):
+                if dielectric_type == "3x3 array":  # same as reference parse, reuse a copy
+                    new_parsed_v_cd_m2 = self._parse_v_Cd_m2(charge_state=charge_state)
+                else:
+                    new_parsed_v_cd_m2 = defect_entry_from_paths(
+                        defect_path=self.v_Cd_m2_DIR,
+                        bulk_path=self.CdTe_BULK_DATA_DIR,
+                        dielectric=dielectric,
+                        charge_state=charge_state,
+                    )
+                assert math.isclose(
+                    new_parsed_v_cd_m2.corrections["freysoldt_charge_correction"],
+                    correct_freysoldt_correction,
+                    abs_tol=atol,
+                )
 
     def test_vacancy_parsing_and_freysoldt(self):
         """
         Test parsing of Cd vacancy calculations and correct Freysoldt
         correction calculated.
         """
-        parsed_vac_Cd_dict = {}
-
-        for i in os.listdir(self.CdTe_EXAMPLE_DIR):
-            # loop folders and parse those with "v_Cd" in name:
-            if os.path.isdir(f"{self.CdTe_EXAMPLE_DIR}/{i}") and "v_Cd" in i:
-                defect_path = f"{self.CdTe_EXAMPLE_DIR}/{i}/vasp_ncl"
-                int(i[-2:].replace("_", ""))
-                # parse with no transformation.json
-                parsed_vac_Cd_dict[i] = defect_entry_from_paths(
-                    defect_path=defect_path,
-                    bulk_path=self.CdTe_BULK_DATA_DIR,
-                    dielectric=self.CdTe_dielectric,
-                )  # Keep dictionary of parsed defect entries
+        # parse folders with "v_Cd" in name, with no transformation.json:
+        parsed_vac_Cd_dict = {  # Keep dictionary of parsed defect entries
+            defect_folder: defect_entry_from_paths(
+                defect_path=f"{self.CdTe_EXAMPLE_DIR}/{defect_folder}/vasp_ncl",
+                bulk_path=self.CdTe_BULK_DATA_DIR,
+                dielectric=self.CdTe_dielectric,
+                **self.CdTe_bulk_data_kwargs,  # same for all defects
+            )
+            for defect_folder in self.CdTe_v_Cd_folders
+        }
 
         assert len(parsed_vac_Cd_dict) == 3
         assert all(f"v_Cd_{i}" in parsed_vac_Cd_dict for i in [0, -1, -2])
         # Check that the correct Freysoldt correction is applied
-        for name, energy, correction_dict in [
-            (
-                "v_Cd_0",
-                4.166,
-                {},
-            ),
-            (
-                "v_Cd_-1",
-                6.355,
-                {
-                    "freysoldt_charge_correction": 0.22517150393292082,
-                },
-            ),
-            (
-                "v_Cd_-2",
-                8.398,
-                {
-                    "freysoldt_charge_correction": 0.7376460317828045,
-                },
-            ),
+        for name, energy, freysoldt_correction in [
+            ("v_Cd_0", 4.166, None),  # neutral, no correction
+            ("v_Cd_-1", 6.355, 0.22517150393292082),
+            ("v_Cd_-2", 8.398, 0.7376460317828045),
         ]:
-            assert np.isclose(parsed_vac_Cd_dict[name].get_ediff(), energy, atol=1e-3)
-            for correction_name, correction_energy in correction_dict.items():
-                assert np.isclose(
-                    parsed_vac_Cd_dict[name].corrections[correction_name],
-                    correction_energy,
-                    atol=1e-3,
+            assert math.isclose(parsed_vac_Cd_dict[name].get_ediff(), energy, abs_tol=1e-3)
+            if freysoldt_correction is not None:
+                assert math.isclose(
+                    parsed_vac_Cd_dict[name].corrections["freysoldt_charge_correction"],
+                    freysoldt_correction,
+                    abs_tol=1e-3,
                 )
 
             # assert auto-determined vacancy site is correct
             # should be: PeriodicSite: Cd (6.5434, 6.5434, 6.5434) [0.5000, 0.5000, 0.5000]
             if name == "v_Cd_0":
-                np.testing.assert_array_almost_equal(
-                    parsed_vac_Cd_dict[name].defect_supercell_site.frac_coords, [0.5, 0.5, 0.5]
+                assert _frac_coords_close(
+                    parsed_vac_Cd_dict[name].defect_supercell_site.frac_coords, (0.5, 0.5, 0.5)
                 )
             else:
-                np.testing.assert_array_almost_equal(
-                    parsed_vac_Cd_dict[name].defect_supercell_site.frac_coords, [0, 0, 0]
+                assert _frac_coords_close(
+                    parsed_vac_Cd_dict[name].defect_supercell_site.frac_coords, (0, 0, 0)
                 )
 
     def test_interstitial_parsing_and_kumagai(self):
@@ -1395,7 +1501,7 @@ class DopedParsingTestCase(unittest.TestCase):
         if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
         with patch("builtins.print") as mock_print:
             te_i_2_ent = defect_entry_from_paths(
-                defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
+                defect_path=self.Int_Te_3_2_DIR,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=self.CdTe_dielectric,
                 charge_state=+2,  # test manually specifying charge state
@@ -1404,43 +1510,42 @@ class DopedParsingTestCase(unittest.TestCase):
         self._check_defect_entry_corrections(te_i_2_ent, -6.2009, 0.9038318161163628)
         # assert auto-determined interstitial site is correct
         # initial position is: PeriodicSite: Te (12.2688, 12.2688, 8.9972) [0.9375, 0.9375, 0.6875]
-        np.testing.assert_array_almost_equal(
-            te_i_2_ent.defect_supercell_site.frac_coords, [0.834511, 0.943944, 0.69776]
+        assert _frac_coords_close(
+            te_i_2_ent.defect_supercell_site.frac_coords, (0.834511, 0.943944, 0.69776)
         )
 
         # run again to check parsing of previous Voronoi sites
         with patch("builtins.print") as mock_print:
             te_i_2_ent = defect_entry_from_paths(
-                defect_path=f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_2/vasp_ncl",
+                defect_path=self.Int_Te_3_2_DIR,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=self.CdTe_dielectric,
                 charge_state=+2,  # test manually specifying charge state
             )
 
         mock_print.assert_not_called()
-        if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
 
     def test_substitution_parsing_and_kumagai(self):
         """
         Test parsing of Te_Cd_1 and Kumagai-Oba (eFNV) correction.
         """
-        for i in os.listdir(self.CdTe_EXAMPLE_DIR):
-            if "Te_Cd" in i:  # loop folders and parse those with "Te_Cd" in name
-                defect_path = f"{self.CdTe_EXAMPLE_DIR}/{i}/vasp_ncl"
-                defect_charge = int(i[-2:].replace("_", ""))
-                # parse with no transformation.json:
-                te_cd_1_ent = defect_entry_from_paths(
-                    defect_path=defect_path,
-                    bulk_path=self.CdTe_BULK_DATA_DIR,
-                    dielectric=self.CdTe_dielectric,
-                    charge_state=defect_charge,
-                )
+        # loop folders and parse those with "Te_Cd" in name:
+        for i, defect_charge in self.CdTe_Te_Cd_folder_charges.items():
+            defect_path = f"{self.CdTe_EXAMPLE_DIR}/{i}/vasp_ncl"
+            # parse with no transformation.json:
+            te_cd_1_ent = defect_entry_from_paths(
+                defect_path=defect_path,
+                bulk_path=self.CdTe_BULK_DATA_DIR,
+                dielectric=self.CdTe_dielectric,
+                charge_state=defect_charge,
+                **self.CdTe_bulk_data_kwargs,  # same for all defects
+            )
 
         self._check_defect_entry_corrections(te_cd_1_ent, -2.6676, 0.23840982963691623)
         # assert auto-determined substitution site is correct
         # should be: PeriodicSite: Te (6.5434, 6.5434, 6.5434) [0.5000, 0.5000, 0.5000]
-        np.testing.assert_array_almost_equal(
-            te_cd_1_ent.defect_supercell_site.frac_coords, [0.475139, 0.475137, 0.524856]
+        assert _frac_coords_close(
+            te_cd_1_ent.defect_supercell_site.frac_coords, (0.475139, 0.475137, 0.524856)
         )
 
     def test_extrinsic_interstitial_defect_ID(self):
@@ -1465,12 +1570,13 @@ class DopedParsingTestCase(unittest.TestCase):
         assert defect_site_idx == len(unrelaxed_defect_structure) - 1
 
         # assert auto-determined interstitial site is correct
-        assert np.isclose(
-            unrelaxed_defect_structure[defect_site_idx].distance_and_image_from_frac_coords(
-                [-0.0005726049122470, -0.0001544430438804, 0.47800736578014720]
-            )[0],
+        assert math.isclose(
+            _mic_distance(
+                unrelaxed_defect_structure[defect_site_idx],
+                [-0.0005726049122470, -0.0001544430438804, 0.47800736578014720],
+            ),
             0.0,
-            atol=1e-2,
+            abs_tol=1e-2,
         )  # approx match, not exact because relaxed bulk supercell
 
     def test_extrinsic_substitution_defect_ID(self):
@@ -1498,10 +1604,10 @@ class DopedParsingTestCase(unittest.TestCase):
         assert defect_site_idx == 63  # last site in structure
 
         # assert auto-determined substitution site is correct
-        np.testing.assert_array_almost_equal(
+        assert _frac_coords_close(
             unrelaxed_defect_structure[defect_site_idx].frac_coords,
-            [0.00, 0.00, 0.00],
-            decimal=2,  # exact match because perfect supercell
+            (0.00, 0.00, 0.00),
+            tol=1.5e-2,  # exact match because perfect supercell
         )
 
     def test_extrinsic_interstitial_parsing_and_kumagai(self):
@@ -1515,7 +1621,7 @@ class DopedParsingTestCase(unittest.TestCase):
         with warnings.catch_warnings(record=True) as w:
             int_F_minus1_ent = defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
                 dielectric=self.ytos_dielectric,
             )
         assert not [warning for warning in w if issubclass(warning.category, UserWarning)]
@@ -1524,23 +1630,22 @@ class DopedParsingTestCase(unittest.TestCase):
             int_F_minus1_ent, 0.7478967131628451, -0.0036182568370900017
         )
         # assert auto-determined interstitial site is correct
-        assert np.isclose(
-            int_F_minus1_ent.defect_supercell_site.distance_and_image_from_frac_coords(
-                [-0.0005726049122470, -0.0001544430438804, 0.4780073657801472]
-            )[
-                0
-            ],  # relaxed site
+        assert math.isclose(
+            _mic_distance(
+                int_F_minus1_ent.defect_supercell_site,
+                [-0.0005726049122470, -0.0001544430438804, 0.4780073657801472],
+            ),  # relaxed site
             0.0,
-            atol=1e-2,
+            abs_tol=1e-2,
         )  # approx match, not exact because relaxed bulk supercell
 
-        if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Bulk", "voronoi_nodes.json"))
+        if_present_rm(os.path.join(self.YTOS_BULK_DATA_DIR, "voronoi_nodes.json"))
 
         # test error_tolerance setting:
         with warnings.catch_warnings(record=True) as w:
             int_F_minus1_ent = defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
                 dielectric=self.ytos_dielectric,
                 error_tolerance=0.001,
             )
@@ -1555,35 +1660,39 @@ class DopedParsingTestCase(unittest.TestCase):
             in str(w[0].message)
         )
 
-        with warnings.catch_warnings(record=True) as w:
-            int_F_minus1_ent.get_kumagai_correction()  # default error tolerance, no warning
-        assert not [warning for warning in w if issubclass(warning.category, UserWarning)]
-
-        with warnings.catch_warnings(record=True) as w:
-            int_F_minus1_ent.get_kumagai_correction(error_tolerance=0.001)
-        assert "Estimated error in the Kumagai (eFNV)" in str(w[0].message)
+        # no warning with default error tolerance, warning with tighter tolerance:
+        self._check_correction_error_warnings(
+            int_F_minus1_ent.get_kumagai_correction, 0.001, "Estimated error in the Kumagai (eFNV)"
+        )
 
         # test returning correction error:
         corr, corr_error = int_F_minus1_ent.get_kumagai_correction(return_correction_error=True)
-        assert np.isclose(corr.correction_energy, correction_dict["kumagai_charge_correction"], atol=1e-3)
-        assert np.isclose(corr_error, 0.003, atol=1e-3)
-        assert np.isclose(
-            int_F_minus1_ent.corrections_metadata["kumagai_charge_correction_error"], 0.003, atol=1e-3
+        assert math.isclose(
+            corr.correction_energy, correction_dict["kumagai_charge_correction"], abs_tol=1e-3
+        )
+        assert math.isclose(corr_error, 0.003, abs_tol=1e-3)
+        assert math.isclose(
+            int_F_minus1_ent.corrections_metadata["kumagai_charge_correction_error"], 0.003, abs_tol=1e-3
         )
 
         # test returning correction error with plot:
         corr, fig, corr_error = int_F_minus1_ent.get_kumagai_correction(
             return_correction_error=True, plot=True
         )
-        assert np.isclose(corr.correction_energy, correction_dict["kumagai_charge_correction"], atol=1e-3)
-        assert np.isclose(corr_error, 0.003, atol=1e-3)
-        assert np.isclose(
-            int_F_minus1_ent.corrections_metadata["kumagai_charge_correction_error"], 0.003, atol=1e-3
+        plt.close(fig)  # only checking the returned values here, so free the figure
+        assert math.isclose(
+            corr.correction_energy, correction_dict["kumagai_charge_correction"], abs_tol=1e-3
+        )
+        assert math.isclose(corr_error, 0.003, abs_tol=1e-3)
+        assert math.isclose(
+            int_F_minus1_ent.corrections_metadata["kumagai_charge_correction_error"], 0.003, abs_tol=1e-3
         )
 
         # test just correction returned with plot = False and return_correction_error = False:
         corr = int_F_minus1_ent.get_kumagai_correction()
-        assert np.isclose(corr.correction_energy, correction_dict["kumagai_charge_correction"], atol=1e-3)
+        assert math.isclose(
+            corr.correction_energy, correction_dict["kumagai_charge_correction"], abs_tol=1e-3
+        )
 
         # test symmetry determination (periodicity breaking does not affect F_i):
         with warnings.catch_warnings(record=True) as w:
@@ -1593,16 +1702,32 @@ class DopedParsingTestCase(unittest.TestCase):
         assert relaxed_defect_name == "F_i_C4v_O2.67"
         assert get_defect_name_from_entry(int_F_minus1_ent, relaxed=False) == "F_i_Cs_O2.67"
 
+    def _check_correction_error_warnings(self, get_correction, error_tolerance, warning_message):
+        """
+        Check that ``get_correction`` (e.g. ``defect_entry.get_kumagai_correction``)
+        warns about the correction error only with the tighter ``error_tolerance``.
+        """
+        for kwargs, expect_warning in [({}, False), ({"error_tolerance": error_tolerance}, True)]:
+            with warnings.catch_warnings(record=True) as w:
+                get_correction(**kwargs)
+            user_warnings = [warning for warning in w if issubclass(warning.category, UserWarning)]
+            if expect_warning:
+                assert warning_message in str(user_warnings[0].message)
+            else:
+                assert not user_warnings
+
     def _check_defect_entry_corrections(self, defect_entry, ediff, correction):
-        assert np.isclose(defect_entry.get_ediff(), ediff, atol=0.001)
-        assert np.isclose(
+        assert math.isclose(defect_entry.get_ediff(), ediff, abs_tol=0.001)
+        assert math.isclose(
             defect_entry.get_ediff() - sum(defect_entry.corrections.values()),
             ediff - correction,
-            atol=0.003,
+            abs_tol=0.003,
         )
         correction_dict = {"kumagai_charge_correction": correction}
         for correction_name, correction_energy in correction_dict.items():
-            assert np.isclose(defect_entry.corrections[correction_name], correction_energy, atol=0.001)
+            assert math.isclose(
+                defect_entry.corrections[correction_name], correction_energy, abs_tol=0.001
+            )
         return correction_dict
 
     def test_extrinsic_substitution_parsing_and_freysoldt_and_kumagai(self):
@@ -1611,25 +1736,22 @@ class DopedParsingTestCase(unittest.TestCase):
         (eFNV) and Freysoldt (FNV) corrections.
         """
         # first using Freysoldt (FNV) correction
-        defect_path = f"{self.YTOS_EXAMPLE_DIR}/F_O_1/"
-        # hide OUTCAR file:
-        shutil.move(f"{defect_path}/OUTCAR.gz", f"{defect_path}/hidden_otcr.gz")
-
-        # parse with no transformation.json or explicitly-set-charge:
-        with warnings.catch_warnings(record=True) as w:
+        defect_path = f"{self.F_O_1_DIR}/"
+        # parse with no transformation.json or explicitly-set-charge, and OUTCAR file hidden:
+        with warnings.catch_warnings(record=True) as w, _hidden_files(defect_path, "OUTCAR.gz"):
             F_O_1_ent = defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
                 dielectric=self.ytos_dielectric,
             )  # check no correction error warning with default tolerance:
         assert len([warning for warning in w if issubclass(warning.category, UserWarning)]) == 1
         assert "An anisotropic dielectric constant was supplied, but `OUTCAR`" in str(w[0].message)
 
         # test error_tolerance setting:
-        with warnings.catch_warnings(record=True) as w:
+        with warnings.catch_warnings(record=True) as w, _hidden_files(defect_path, "OUTCAR.gz"):
             F_O_1_ent = defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
                 dielectric=self.ytos_dielectric,
                 error_tolerance=0.00001,
             )  # check no correction error warning with default tolerance:
@@ -1645,36 +1767,31 @@ class DopedParsingTestCase(unittest.TestCase):
             for warning in w
         )
 
-        with warnings.catch_warnings(record=True) as w:
-            F_O_1_ent.get_freysoldt_correction()  # default error tolerance, no warning
-        assert not [warning for warning in w if issubclass(warning.category, UserWarning)]
-
-        with warnings.catch_warnings(record=True) as w:
-            F_O_1_ent.get_freysoldt_correction(error_tolerance=0.00001)
-        assert "Estimated error in the Freysoldt (FNV)" in str(w[0].message)
+        # no warning with default error tolerance, warning with tighter tolerance:
+        self._check_correction_error_warnings(
+            F_O_1_ent.get_freysoldt_correction, 0.00001, "Estimated error in the Freysoldt (FNV)"
+        )
 
         # test returning correction error:
         corr, corr_error = F_O_1_ent.get_freysoldt_correction(return_correction_error=True)
-        assert np.isclose(corr.correction_energy, 0.11670254204631794, atol=1e-3)
-        assert np.isclose(corr_error, 0.000, atol=1e-3)
-        assert np.isclose(
-            F_O_1_ent.corrections_metadata["freysoldt_charge_correction_error"], 0.000, atol=1e-3
+        assert math.isclose(corr.correction_energy, 0.11670254204631794, abs_tol=1e-3)
+        assert math.isclose(corr_error, 0.000, abs_tol=1e-3)
+        assert math.isclose(
+            F_O_1_ent.corrections_metadata["freysoldt_charge_correction_error"], 0.000, abs_tol=1e-3
         )
 
         # test returning correction error with plot:
         corr, fig, corr_error = F_O_1_ent.get_freysoldt_correction(return_correction_error=True, plot=True)
-        assert np.isclose(corr.correction_energy, 0.11670254204631794, atol=1e-3)
-        assert np.isclose(corr_error, 0.000, atol=1e-3)
-        assert np.isclose(
-            F_O_1_ent.corrections_metadata["freysoldt_charge_correction_error"], 0.000, atol=1e-3
+        plt.close(fig)  # only checking the returned values here, so free the figure
+        assert math.isclose(corr.correction_energy, 0.11670254204631794, abs_tol=1e-3)
+        assert math.isclose(corr_error, 0.000, abs_tol=1e-3)
+        assert math.isclose(
+            F_O_1_ent.corrections_metadata["freysoldt_charge_correction_error"], 0.000, abs_tol=1e-3
         )
 
         # test just correction returned with plot = False and return_correction_error = False:
         corr = F_O_1_ent.get_freysoldt_correction()
-        assert np.isclose(corr.correction_energy, 0.11670254204631794, atol=1e-3)
-
-        # move OUTCAR file back to original:
-        shutil.move(f"{defect_path}/hidden_otcr.gz", f"{defect_path}/OUTCAR.gz")
+        assert math.isclose(corr.correction_energy, 0.11670254204631794, abs_tol=1e-3)
 
         self._test_F_O_1_ent(
             F_O_1_ent,
@@ -1683,11 +1800,11 @@ class DopedParsingTestCase(unittest.TestCase):
             0.11670254204631794,
         )
         # now using Kumagai-Oba (eFNV) correction
-        defect_path = f"{self.YTOS_EXAMPLE_DIR}/F_O_1/"
+        defect_path = f"{self.F_O_1_DIR}/"
         # parse with no transformation.json or explicitly-set-charge:
         F_O_1_ent = defect_entry_from_paths(
             defect_path=defect_path,
-            bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+            bulk_path=self.YTOS_BULK_DATA_DIR,
             dielectric=self.ytos_dielectric,
             charge_state=1,
         )
@@ -1703,15 +1820,15 @@ class DopedParsingTestCase(unittest.TestCase):
         assert get_defect_name_from_entry(F_O_1_ent, relaxed=False) == "F_O_D4h_Ti1.79"
 
     def _test_F_O_1_ent(self, F_O_1_ent, ediff, correction_name, correction):
-        assert np.isclose(F_O_1_ent.get_ediff(), ediff, atol=1e-3)
+        assert math.isclose(F_O_1_ent.get_ediff(), ediff, abs_tol=1e-3)
         correction_test_dict = {correction_name: correction}
         for correction_name, correction_energy in correction_test_dict.items():
-            assert np.isclose(F_O_1_ent.corrections[correction_name], correction_energy, atol=1e-3)
+            assert math.isclose(F_O_1_ent.corrections[correction_name], correction_energy, abs_tol=1e-3)
         # assert auto-determined interstitial site is correct
-        assert np.isclose(
-            F_O_1_ent.defect_supercell_site.distance_and_image_from_frac_coords([0, 0, 0])[0],
+        assert math.isclose(
+            _mic_distance(F_O_1_ent.defect_supercell_site, [0, 0, 0]),
             0.0,
-            atol=1e-2,
+            abs_tol=1e-2,
         )
 
         return correction_test_dict
@@ -1723,18 +1840,18 @@ class DopedParsingTestCase(unittest.TestCase):
         and re-parsed.
         """
         with patch("builtins.print"):
-            for i in os.listdir(self.CdTe_EXAMPLE_DIR):
-                if "Int_Te" in i:  # loop folders and parse those with "Int_Te" in name
-                    defect_path = f"{self.CdTe_EXAMPLE_DIR}/{i}/vasp_ncl"
-                    # parse with no transformation.json or explicitly-set-charge:
-                    defect_entry_from_paths(
-                        defect_path=defect_path,
-                        bulk_path=self.CdTe_BULK_DATA_DIR,
-                        dielectric=self.CdTe_dielectric,
-                    )
+            for i in self.CdTe_Int_Te_folders:  # loop folders and parse those with "Int_Te" in name
+                defect_path = f"{self.CdTe_EXAMPLE_DIR}/{i}/vasp_ncl"
+                # parse with no transformation.json or explicitly-set-charge:
+                defect_entry_from_paths(
+                    defect_path=defect_path,
+                    bulk_path=self.CdTe_BULK_DATA_DIR,
+                    dielectric=self.CdTe_dielectric,
+                    **self.CdTe_bulk_data_kwargs,  # same for all defects
+                )
         shutil.copyfile(
             os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"),
-            f"{self.YTOS_EXAMPLE_DIR}/Bulk/voronoi_nodes.json",
+            os.path.join(self.YTOS_BULK_DATA_DIR, "voronoi_nodes.json"),
         )  # mismatching voronoi nodes
 
         with warnings.catch_warnings(record=True) as w:
@@ -1742,7 +1859,7 @@ class DopedParsingTestCase(unittest.TestCase):
             # parse with no transformation.json or explicitly-set-charge:
             defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
                 dielectric=self.ytos_dielectric,
                 charge_state=-1,  # test manually specifying charge state
             )
@@ -1754,7 +1871,6 @@ class DopedParsingTestCase(unittest.TestCase):
         user_warnings = [warning for warning in w if warning.category == UserWarning]
         assert len(user_warnings) == 1
         assert warning_message in str(user_warnings[0].message)
-        if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Bulk", "voronoi_nodes.json"))
 
     def test_tricky_relaxed_interstitial_corrections_kumagai(self):
         """
@@ -1764,29 +1880,16 @@ class DopedParsingTestCase(unittest.TestCase):
 
         2022 doi.org/10.1039/D2FD00043A).
         """
-        from pydefect.analyzer.calc_results import CalcResults
-        from pydefect.cli.vasp.make_efnv_correction import make_efnv_correction
-
-        def _make_calc_results(directory) -> CalcResults:
-            vasprun = get_vasprun(f"{directory}/vasprun.xml.gz")
-            outcar = get_outcar(f"{directory}/OUTCAR.gz")
-            return CalcResults(
-                structure=vasprun.final_structure,
-                energy=outcar.final_energy,
-                magnetization=outcar.total_mag or 0.0,
-                potentials=[-p for p in outcar.electrostatic_potential],
-                electronic_conv=vasprun.converged_electronic,
-                ionic_conv=vasprun.converged_ionic,
-            )
-
-        bulk_calc_results = _make_calc_results(f"{self.CdTe_BULK_DATA_DIR}")
+        # calc results are only read, so use (and cache) those from the static examples tree:
+        CdTe_example_dir = os.path.join(self.EXAMPLE_DIR, "CdTe")
+        bulk_calc_results = _make_calc_results(f"{CdTe_example_dir}/CdTe_bulk/vasp_ncl")
 
         for name, correction_energy in [
             ("Int_Te_3_Unperturbed_1", 0.2974374231312522),
             ("Int_Te_3_1", 0.3001740745077274),
         ]:
             print("Testing", name)
-            defect_calc_results = _make_calc_results(f"{self.CdTe_EXAMPLE_DIR}/{name}/vasp_ncl")
+            defect_calc_results = _make_calc_results(f"{CdTe_example_dir}/{name}/vasp_ncl")
             raw_efnv = make_efnv_correction(
                 +1, defect_calc_results, bulk_calc_results, self.CdTe_dielectric
             )
@@ -1795,6 +1898,7 @@ class DopedParsingTestCase(unittest.TestCase):
                 defect_path=f"{self.CdTe_EXAMPLE_DIR}/{name}/vasp_ncl",
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=9.13,
+                **self.CdTe_bulk_data_kwargs,  # same for all defects
             )
 
             efnv_w_doped_site = make_efnv_correction(
@@ -1805,9 +1909,13 @@ class DopedParsingTestCase(unittest.TestCase):
                 defect_coords=Te_i_ent.sc_defect_frac_coords,
             )
 
-            assert np.isclose(raw_efnv.correction_energy, efnv_w_doped_site.correction_energy, atol=1e-3)
-            assert np.isclose(raw_efnv.correction_energy, sum(Te_i_ent.corrections.values()), atol=1e-3)
-            assert np.isclose(raw_efnv.correction_energy, correction_energy, atol=1e-3)
+            assert math.isclose(
+                raw_efnv.correction_energy, efnv_w_doped_site.correction_energy, abs_tol=1e-3
+            )
+            assert math.isclose(
+                raw_efnv.correction_energy, sum(Te_i_ent.corrections.values()), abs_tol=1e-3
+            )
+            assert math.isclose(raw_efnv.correction_energy, correction_energy, abs_tol=1e-3)
 
             efnv_w_fcked_site = make_efnv_correction(
                 +1,
@@ -1817,8 +1925,8 @@ class DopedParsingTestCase(unittest.TestCase):
                 defect_coords=Te_i_ent.sc_defect_frac_coords + 0.1,  # shifting to wrong defect site
                 # affects correction as expected (~0.02 eV = 7% in this case)
             )
-            assert not np.isclose(efnv_w_fcked_site.correction_energy, correction_energy, atol=1e-3)
-            assert np.isclose(efnv_w_fcked_site.correction_energy, correction_energy, atol=1e-1)
+            assert not math.isclose(efnv_w_fcked_site.correction_energy, correction_energy, abs_tol=1e-3)
+            assert math.isclose(efnv_w_fcked_site.correction_energy, correction_energy, abs_tol=1e-1)
 
     def test_no_dielectric_warning(self):
         """
@@ -1832,7 +1940,7 @@ class DopedParsingTestCase(unittest.TestCase):
             warnings.resetwarnings()
             defect_entry_from_paths(
                 defect_path=defect_path,
-                bulk_path=f"{self.YTOS_EXAMPLE_DIR}/Bulk/",
+                bulk_path=self.YTOS_BULK_DATA_DIR,
             )
         assert len([warning for warning in w if issubclass(warning.category, UserWarning)]) == 1
         assert all(
@@ -1853,20 +1961,23 @@ class DopedParsingTestCase(unittest.TestCase):
 
 
 class DopedParsingFunctionsTestCase(unittest.TestCase):
-    def setUp(self):
-        DopedParsingTestCase.setUp(self)  # get attributes from DopedParsingTestCase
-        self.data_dir = os.path.join(os.path.dirname(__file__), "data")
-        self.prim_cdte = Structure.from_file(f"{self.EXAMPLE_DIR}/CdTe/relaxed_primitive_POSCAR")
-        self.ytos_bulk_supercell = Structure.from_file(f"{self.EXAMPLE_DIR}/YTOS/Bulk/POSCAR")
-        self.lmno_primitive = Structure.from_file(f"{self.data_dir}/Li2Mn3NiO8_POSCAR")
-        self.non_diagonal_ZnS = Structure.from_file(f"{self.data_dir}/non_diagonal_ZnS_supercell_POSCAR")
+    @classmethod
+    def setUpClass(cls):
+        DopedParsingTestCase._set_up_examples.__func__(cls)  # shared class attributes
+        cls.data_dir = os.path.join(cls.module_path, "data")
+        # only read, so parse once for all tests:
+        cls.prim_cdte = Structure.from_file(f"{cls.EXAMPLE_DIR}/CdTe/relaxed_primitive_POSCAR")
+        cls.ytos_bulk_supercell = Structure.from_file(f"{cls.EXAMPLE_DIR}/YTOS/Bulk/POSCAR")
+        cls.lmno_primitive = Structure.from_file(f"{cls.data_dir}/Li2Mn3NiO8_POSCAR")
+        cls.non_diagonal_ZnS = Structure.from_file(f"{cls.data_dir}/non_diagonal_ZnS_supercell_POSCAR")
 
         # TODO: Try rattling the structures (and modifying symprec a little to test tolerance?)
 
+    def setUp(self):
+        DopedParsingTestCase.setUp(self)  # get linked bulk folders from DopedParsingTestCase
+
     def tearDown(self):
-        if_present_rm(os.path.join(self.CdTe_BULK_DATA_DIR, "voronoi_nodes.json"))
-        if_present_rm(os.path.join(self.YTOS_EXAMPLE_DIR, "Bulk", "voronoi_nodes.json"))
-        if_present_rm("./vasprun.xml")
+        DopedParsingTestCase.tearDown(self)
 
     def test_defect_name_from_structures(self):
         # by proxy also tests defect_from_structures
@@ -1878,13 +1989,11 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
         ]:
             defect_gen = DefectsGenerator(struct)
             for defect_entry in [entry for entry in defect_gen.values() if entry.charge_state == 0]:
-                print(
-                    defect_from_structures(defect_entry.bulk_supercell, defect_entry.defect_supercell),
-                    defect_entry.defect_supercell_site,
-                )
                 assert defect_name_from_structures(
                     defect_entry.bulk_supercell, defect_entry.defect_supercell
-                ) == get_defect_name_from_defect(defect_entry.defect)
+                ) == get_defect_name_from_defect(
+                    defect_entry.defect
+                ), f"{defect_entry.name}: {defect_entry.defect_supercell_site}"
 
                 # Can't use defect.structure/defect.defect_structure because might be vacancy in a 1/2
                 # atom cell etc.:
@@ -1917,14 +2026,17 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
                 ]
             )
 
-        # edit vasprun.xml.gz to have different INCAR tags:
+        # edit vasprun.xml.gz to have different INCAR tags, writing to the per-test work directory:
+        edited_defect_dir = os.path.join(self._work_dir, "edited_Int_Te_3_Unperturbed_1")
+        os.mkdir(edited_defect_dir)
+        edited_vasprun_path = os.path.join(edited_defect_dir, "vasprun.xml")
         with gzip.open(
             f"{self.CdTe_EXAMPLE_DIR}/Int_Te_3_Unperturbed_1/vasp_ncl/vasprun.xml.gz", "rb"
-        ) as f_in, open("./vasprun.xml", "wb") as f_out:
+        ) as f_in, open(edited_vasprun_path, "wb") as f_out:
             shutil.copyfileobj(f_in, f_out)
 
         # open vasprun.xml, edit ENCUT and add LDAU to INCAR but with default value:
-        with open("./vasprun.xml") as f:  # line 11 (10 in python indexing) is start of INCAR
+        with open(edited_vasprun_path) as f:  # line 11 (10 in python indexing) is start of INCAR
             lines = f.readlines()
             for i, line in enumerate(lines):
                 if '<i name="ENCUT">' in line:
@@ -1933,13 +2045,13 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
 
             new_vr_lines = lines[:11] + ['  <i type="logical" name="LDAU"> F  </i>\n'] + lines[11:]
 
-        with open("./vasprun.xml", "w") as f_out:
+        with open(edited_vasprun_path, "w") as f_out:
             f_out.writelines(new_vr_lines)
 
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
             defect_entry_from_paths(
-                defect_path=".",
+                defect_path=edited_defect_dir,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=9.13,
                 skip_corrections=True,
@@ -1959,13 +2071,13 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
                 lines[i] = lines[i].replace("0.500000", "0.125")
                 break
 
-        with open("./vasprun.xml", "w") as f_out:
+        with open(edited_vasprun_path, "w") as f_out:
             f_out.writelines(lines)
 
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
             defect_entry_from_paths(
-                defect_path=".",
+                defect_path=edited_defect_dir,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=9.13,
                 skip_corrections=True,
@@ -1988,13 +2100,13 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
                 lines[i] = lines[i].replace("Cd", "Cd_GW")
                 break
 
-        with open("./vasprun.xml", "w") as f_out:
+        with open(edited_vasprun_path, "w") as f_out:
             f_out.writelines(lines)
 
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
             defect_entry_from_paths(
-                defect_path=".",
+                defect_path=edited_defect_dir,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=9.13,
                 skip_corrections=True,
@@ -2019,13 +2131,13 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
                 lines[i + len(lines) - 1000] = line.replace("13.08676800", "3000")  # went to the year 3000
                 break
 
-        with open("./vasprun.xml", "w") as f_out:
+        with open(edited_vasprun_path, "w") as f_out:
             f_out.writelines(lines)
 
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
             defect_entry_from_paths(
-                defect_path=".",
+                defect_path=edited_defect_dir,
                 bulk_path=self.CdTe_BULK_DATA_DIR,
                 dielectric=9.13,
                 skip_corrections=True,
@@ -2071,6 +2183,79 @@ class DopedParsingFunctionsTestCase(unittest.TestCase):
     #         assert np.isclose(orientational_degeneracy, 0.25, atol=1e-2)
 
 
+class CorrectionDataParsingTestCase(unittest.TestCase):
+    """
+    Test the parsing of the ``LOCPOT`` and ``OUTCAR`` data used for the charge
+    corrections, against the full pymatgen ``Locpot`` and ``Outcar`` parsing.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module_path = os.path.dirname(os.path.abspath(__file__))
+        cls.CdTe_EXAMPLE_DIR = os.path.join(cls.module_path, "../examples/CdTe")
+        cls.CdTe_BULK_DATA_DIR = os.path.join(cls.CdTe_EXAMPLE_DIR, "CdTe_bulk/vasp_ncl")
+        cls.Int_Te_3_2_DIR = os.path.join(cls.CdTe_EXAMPLE_DIR, "Int_Te_3_2/vasp_ncl")
+
+    def _check_locpot_planar_averages(self, locpot_path):
+        planar_averages = get_locpot_planar_averages(locpot_path)
+        locpot = Locpot.from_file(locpot_path)
+        assert list(planar_averages) == [0, 1, 2]
+        for axis in range(3):
+            np.testing.assert_allclose(planar_averages[axis], locpot.get_average_along_axis(axis))
+
+    def test_get_locpot_planar_averages(self):
+        for locpot_path in [f"{self.CdTe_BULK_DATA_DIR}/LOCPOT.gz", f"{self.Int_Te_3_2_DIR}/LOCPOT.gz"]:
+            with self.subTest(locpot_path=locpot_path):
+                self._check_locpot_planar_averages(locpot_path)
+
+    def test_get_locpot_planar_averages_spin_polarised(self):
+        # only the first (total) potential grid should be parsed, for both uncompressed and compressed
+        # LOCPOTs:
+        structure = Structure(
+            Lattice([[0, 3.3, 3.3], [3.3, 0, 3.3], [3.3, 3.3, 0]]), ["Cd", "Te"], [[0, 0, 0], [0.25] * 3]
+        )
+        rng = np.random.default_rng(42)
+        spin_polarised_locpot = Locpot(
+            Poscar(structure), {"total": rng.normal(size=(6, 8, 10)), "diff": rng.normal(size=(6, 8, 10))}
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            locpot_path = os.path.join(tmp_dir, "LOCPOT")
+            spin_polarised_locpot.write_file(locpot_path)
+            with open(locpot_path, "rb") as f_in, gzip.open(f"{locpot_path}.gz", "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+            for path in [locpot_path, f"{locpot_path}.gz"]:
+                with self.subTest(locpot_path=path):
+                    assert Locpot.from_file(path).is_spin_polarized
+                    self._check_locpot_planar_averages(path)
+
+    def test_get_core_potentials(self):
+        for outcar_path in [f"{self.CdTe_BULK_DATA_DIR}/OUTCAR.gz", f"{self.Int_Te_3_2_DIR}/OUTCAR.gz"]:
+            with self.subTest(outcar_path=outcar_path):
+                core_potentials = get_core_potentials(outcar_path)
+                assert core_potentials  # not None or empty
+                assert core_potentials == Outcar(outcar_path).electrostatic_potential
+
+        # OUTCAR cut off partway through the core potentials block of a following ionic step (e.g.
+        # killed at walltime), should parse the last complete block as in pymatgen:
+        with gzip.open(f"{self.Int_Te_3_2_DIR}/OUTCAR.gz", "rt") as f:
+            outcar_text = f.read()
+        final_header_idx = outcar_text.rfind("(the norm of the test charge is")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outcar_path = os.path.join(tmp_dir, "OUTCAR")
+            with open(outcar_path, "w") as f:
+                f.write(outcar_text + outcar_text[final_header_idx : final_header_idx + 500])
+            core_potentials = get_core_potentials(outcar_path)
+            assert core_potentials  # not None or empty
+            assert core_potentials == Outcar(outcar_path).electrostatic_potential
+            assert core_potentials == get_core_potentials(f"{self.Int_Te_3_2_DIR}/OUTCAR.gz")
+
+        # OUTCAR without core potentials (ICORELEVEL != 0):
+        outcar_path = f"{self.Int_Te_3_2_DIR}/OUTCAR_no_core_levels.gz"
+        assert Outcar(outcar_path).electrostatic_potential is None
+        assert get_core_potentials(outcar_path) is None
+
+
 class ReorderedParsingTestCase(unittest.TestCase):
     """
     Test cases where the atoms bulk and defect supercells have been reordered
@@ -2078,11 +2263,13 @@ class ReorderedParsingTestCase(unittest.TestCase):
     are still correctly performed.
     """
 
-    def setUp(self):
-        self.module_path = os.path.dirname(os.path.abspath(__file__))
-        self.CdTe_corrections_dir = os.path.join(self.module_path, "data/CdTe_charge_correction_tests")
-        self.v_Cd_m2_path = f"{self.CdTe_corrections_dir}/v_Cd_-2_vasp_gam"
-        self.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
+    @classmethod
+    def setUpClass(cls):
+        cls.module_path = os.path.dirname(os.path.abspath(__file__))
+        cls.CdTe_corrections_dir = os.path.join(cls.module_path, "data/CdTe_charge_correction_tests")
+        cls.v_Cd_m2_path = f"{cls.CdTe_corrections_dir}/v_Cd_-2_vasp_gam"
+        cls.CdTe_dielectric = np.array([[9.13, 0, 0], [0.0, 9.13, 0], [0, 0, 9.13]])  # CdTe
+        cls.CdTe_dielectric.flags.writeable = False
 
     def test_parsing_cdte(self):
         """
@@ -2143,20 +2330,19 @@ class ReorderedParsingTestCase(unittest.TestCase):
         Test Freysoldt defect correction parser can handle mismatched atomic
         orders.
         """
-        shutil.move(f"{self.v_Cd_m2_path}/OUTCAR.gz", f"{self.v_Cd_m2_path}/hidden_otcr.gz")  # use FNV
-        parsed_v_cd_m2_orig = defect_entry_from_paths(
-            defect_path=self.v_Cd_m2_path,
-            bulk_path=f"{self.CdTe_corrections_dir}/bulk_vasp_gam",
-            dielectric=self.CdTe_dielectric,
-            charge_state=-2,
-        )
-        parsed_v_cd_m2_alt = defect_entry_from_paths(
-            defect_path=self.v_Cd_m2_path,
-            bulk_path=f"{self.CdTe_corrections_dir}/bulk_vasp_gam_alt",
-            dielectric=self.CdTe_dielectric,
-            charge_state=-2,
-        )
-        shutil.move(f"{self.v_Cd_m2_path}/hidden_otcr.gz", f"{self.v_Cd_m2_path}/OUTCAR.gz")  # move back
+        with _hidden_files(self.v_Cd_m2_path, "OUTCAR.gz"):  # use FNV
+            parsed_v_cd_m2_orig = defect_entry_from_paths(
+                defect_path=self.v_Cd_m2_path,
+                bulk_path=f"{self.CdTe_corrections_dir}/bulk_vasp_gam",
+                dielectric=self.CdTe_dielectric,
+                charge_state=-2,
+            )
+            parsed_v_cd_m2_alt = defect_entry_from_paths(
+                defect_path=self.v_Cd_m2_path,
+                bulk_path=f"{self.CdTe_corrections_dir}/bulk_vasp_gam_alt",
+                dielectric=self.CdTe_dielectric,
+                charge_state=-2,
+            )
 
         # should use Freysoldt correction by default when OUTCARs not available
         assert np.isclose(parsed_v_cd_m2_orig.get_ediff(), parsed_v_cd_m2_alt.get_ediff())
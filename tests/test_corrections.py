@@ -13,14 +13,15 @@ from unittest.mock import patch
 import matplotlib as mpl
 import numpy as np
 import pytest
+from pymatgen.analysis.defects.corrections import freysoldt
 from pymatgen.core.sites import PeriodicSite
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.util.testing import PymatgenTest
 from test_analysis import if_present_rm
 
-from doped import analysis
+from doped import analysis, corrections
 from doped.core import DefectEntry, Vacancy
-from doped.corrections import get_freysoldt_correction, get_kumagai_correction
+from doped.corrections import get_freysoldt_correction, get_kumagai_correction, get_kumagai_corrections
 
 mpl.use("Agg")  # don't show interactive plots if testing from CLI locally
 
@@ -142,6 +143,55 @@ class FiniteSizeChargeCorrectionTest(PymatgenTest):
             get_kumagai_correction(self.defect_entry, self.dielectric, verbose=False)
         mock_print.assert_not_called()
 
+    def test_get_kumagai_corrections(self):
+        for processes in [1, 2]:
+            efnv_corr_list = get_kumagai_corrections(
+                [self.defect_entry] * 2, processes=processes, dielectric=self.dielectric, verbose=False
+            )
+            assert len(efnv_corr_list) == 2
+            for efnv_corr in efnv_corr_list:
+                assert np.isclose(efnv_corr.correction_energy, 1.2651776920778381)
+
+    def test_stored_corrections_reused(self):
+        # repeated ``DefectEntry`` correction calls with the same inputs (e.g. for plotting, or with a
+        # different ``error_tolerance``) reuse the correction stored on the entry:
+        with patch(
+            "doped.corrections.freysoldt.get_freysoldt_correction",
+            wraps=freysoldt.get_freysoldt_correction,
+        ) as mock_get_fnv:
+            fnv_corr = self.defect_entry.get_freysoldt_correction(self.dielectric)
+            _fnv_corr, fnv_corr_error = self.defect_entry.get_freysoldt_correction(
+                self.dielectric, return_correction_error=True, error_tolerance=1e-3
+            )
+            assert np.isclose(_fnv_corr.correction_energy, fnv_corr.correction_energy)
+            assert np.isclose(
+                fnv_corr_error, self.defect_entry.corrections_metadata["freysoldt_charge_correction_error"]
+            )
+            _fnv_corr, _fig = self.defect_entry.get_freysoldt_correction(self.dielectric, plot=True)
+            assert np.isclose(_fnv_corr.correction_energy, fnv_corr.correction_energy)
+            assert mock_get_fnv.call_count == 1
+
+            # recomputed for different inputs:
+            self.defect_entry.get_freysoldt_correction(self.dielectric * 2)
+            assert mock_get_fnv.call_count == 2
+            get_freysoldt_correction(
+                self.defect_entry,
+                self.dielectric * 2,
+                defect_locpot=self.defect_entry.calculation_metadata["defect_locpot_dict"],
+            )
+            assert mock_get_fnv.call_count == 3
+
+        with patch(
+            "doped.corrections._get_ewald_site_potentials", wraps=corrections._get_ewald_site_potentials
+        ) as mock_get_site_potentials:
+            efnv_corr = self.defect_entry.get_kumagai_correction(self.dielectric)
+            _efnv_corr, _fig = self.defect_entry.get_kumagai_correction(self.dielectric, plot=True)
+            assert np.isclose(_efnv_corr.correction_energy, efnv_corr.correction_energy)
+            assert mock_get_site_potentials.call_count == 1
+
+            self.defect_entry.get_kumagai_correction(self.dielectric, defect_region_radius=5)
+            assert mock_get_site_potentials.call_count == 2
+
 
 class CorrectionsPlottingTestCase(unittest.TestCase):
     module_path: str
@@ -3,15 +3,17 @@ Tests for the `doped.generation` module.
 
 Implicitly tests the `doped.utils.symmetry` module as well.
 """
+import contextlib
 import copy
 import filecmp
 import json
 import os
 import random
 import shutil
-import sys
+import tempfile
 import unittest
 import warnings
+from functools import lru_cache
 from io import StringIO
 from unittest.mock import patch
 
@@ -21,7 +23,7 @@ from monty.json import MontyEncoder
 from monty.serialization import dumpfn, loadfn
 from pymatgen.analysis.defects.core import DefectType
 from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
-from pymatgen.core.structure import PeriodicSite, Structure
+from pymatgen.core.structure import IStructure, PeriodicSite, Structure
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.io.vasp import Poscar
@@ -46,6 +48,7 @@ def if_present_rm(path):
             shutil.rmtree(path)
 
 
+@lru_cache(maxsize=None)  # static property of the test environment, so only check once
 def _potcars_available() -> bool:
     """
     Check if the POTCARs are available for the tests (i.e. testing locally).
@@ -59,28 +62,55 @@ def _potcars_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=32)  # same input structures are used across many tests
+def _get_conventional_standard_structure(structure: IStructure) -> Structure:
+    """
+    Get the (pymatgen) conventional standard structure of the input structure,
+    cached to avoid repeating the ``spglib`` symmetry search.
+    """
+    return SpacegroupAnalyzer(structure).get_conventional_standard_structure()
+
+
+def _matrices_close(matrix, other_matrix, **kwargs):
+    """
+    ``np.allclose`` for (lattice) matrices, short-circuiting when the matrices
+    are the same array or exactly equal, as is usually the case for structures
+    derived from the same lattice.
+    """
+    return (
+        matrix is other_matrix
+        or np.array_equal(matrix, other_matrix)
+        or np.allclose(matrix, other_matrix, **kwargs)
+    )
+
+
 class DefectsGeneratorTest(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # don't run heavy tests on GH Actions, these are run locally (too slow without multiprocessing etc)
-        self.heavy_tests = bool(_potcars_available())
-
-        self.data_dir = os.path.join(os.path.dirname(__file__), "data")
-        self.CdTe_data_dir = os.path.join(self.data_dir, "CdTe")
-        self.example_dir = os.path.join(os.path.dirname(__file__), "..", "examples")
-        self.prim_cdte = Structure.from_file(f"{self.example_dir}/CdTe/relaxed_primitive_POSCAR")
-        sga = SpacegroupAnalyzer(self.prim_cdte)
-        self.conv_cdte = sga.get_conventional_standard_structure()
-        self.fd_up_sc_entry = ComputedStructureEntry(self.conv_cdte, 420, correction=0.0)  # for testing
+        cls.heavy_tests = bool(_potcars_available())
+
+        module_path = os.path.dirname(os.path.abspath(__file__))  # absolute, as tests run in temp dirs
+        cls.data_dir = os.path.join(module_path, "data")
+        cls.CdTe_data_dir = os.path.join(cls.data_dir, "CdTe")
+        cls.example_dir = os.path.join(module_path, "..", "examples")
+        cls.prim_cdte = Structure.from_file(f"{cls.example_dir}/CdTe/relaxed_primitive_POSCAR")
+        sga = SpacegroupAnalyzer(cls.prim_cdte)
+        cls.conv_cdte = sga.get_conventional_standard_structure()
+        cls.fd_up_sc_entry = ComputedStructureEntry(cls.conv_cdte, 420, correction=0.0)  # for testing
         # in _check_editing_defect_gen() later
-        self.structure_matcher = StructureMatcher(
-            comparator=ElementComparator()
-        )  # ignore oxidation states
-        self.CdTe_bulk_supercell = self.conv_cdte * 2 * np.eye(3)
-        self.CdTe_defect_gen_string = (
+        cls.structure_matcher = StructureMatcher(comparator=ElementComparator())  # ignore oxidation states
+        # for matching structures with the same (super)cell, where the (slow) reduction of both
+        # structures to their primitive cells can be skipped:
+        cls.supercell_structure_matcher = StructureMatcher(
+            comparator=ElementComparator(), primitive_cell=False
+        )
+        cls.CdTe_bulk_supercell = cls.conv_cdte * 2
+        cls.CdTe_defect_gen_string = (
             "DefectsGenerator for input composition CdTe, space group F-43m with 50 defect entries "
             "created."
         )
-        self.CdTe_defect_gen_info = (
+        cls.CdTe_defect_gen_info = (
             """Vacancies    Guessed Charges    Conv. Cell Coords    Wyckoff
 -----------  -----------------  -------------------  ---------
 v_Cd         [+1,0,-1,-2]       [0.000,0.000,0.000]  4a
@@ -106,12 +136,12 @@ Te_i_Td_Te2.83   [+4,+3,+2,+1,0,-1,-2]  [0.500,0.500,0.500]  4b
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.ytos_bulk_supercell = Structure.from_file(f"{self.example_dir}/YTOS/Bulk/POSCAR")
-        self.ytos_defect_gen_string = (
+        cls.ytos_bulk_supercell = Structure.from_file(f"{cls.example_dir}/YTOS/Bulk/POSCAR")
+        cls.ytos_defect_gen_string = (
             "DefectsGenerator for input composition Y2Ti2S2O5, space group I4/mmm with 221 defect "
             "entries created."
         )
-        self.ytos_defect_gen_info = (
+        cls.ytos_defect_gen_info = (
             """Vacancies    Guessed Charges     Conv. Cell Coords    Wyckoff
 -----------  ------------------  -------------------  ---------
 v_Y          [+1,0,-1,-2,-3]     [0.000,0.000,0.334]  4e
@@ -171,12 +201,12 @@ O_i_D2d          [0,-1,-2]              [0.000,0.500,0.250]  4d
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.lmno_primitive = Structure.from_file(f"{self.data_dir}/Li2Mn3NiO8_POSCAR")
-        self.lmno_defect_gen_string = (
+        cls.lmno_primitive = Structure.from_file(f"{cls.data_dir}/Li2Mn3NiO8_POSCAR")
+        cls.lmno_defect_gen_string = (
             "DefectsGenerator for input composition Li2Mn3NiO8, space group P4_332 with 182 defect "
             "entries created."
         )
-        self.lmno_defect_gen_info = (
+        cls.lmno_defect_gen_info = (
             """Vacancies    Guessed Charges     Conv. Cell Coords    Wyckoff
 -----------  ------------------  -------------------  ---------
 v_Li         [+1,0,-1]           [0.004,0.004,0.004]  8c
@@ -236,12 +266,12 @@ O_i_C3               [0,-1,-2]          [0.497,0.497,0.497]  8c
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.non_diagonal_ZnS = Structure.from_file(f"{self.data_dir}/non_diagonal_ZnS_supercell_POSCAR")
-        self.zns_defect_gen_string = (
+        cls.non_diagonal_ZnS = Structure.from_file(f"{cls.data_dir}/non_diagonal_ZnS_supercell_POSCAR")
+        cls.zns_defect_gen_string = (
             "DefectsGenerator for input composition ZnS, space group F-43m with 44 defect entries "
             "created."
         )
-        self.zns_defect_gen_info = (
+        cls.zns_defect_gen_info = (
             """Vacancies    Guessed Charges    Conv. Cell Coords    Wyckoff
 -----------  -----------------  -------------------  ---------
 v_Zn         [+1,0,-1,-2]       [0.000,0.000,0.000]  4a
@@ -267,11 +297,11 @@ S_i_Td_Zn2.35    [+2,+1,0,-1,-2]    [0.750,0.750,0.750]  4d
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.prim_cu = Structure.from_file(f"{self.data_dir}/Cu_prim_POSCAR")
-        self.cu_defect_gen_string = (
+        cls.prim_cu = Structure.from_file(f"{cls.data_dir}/Cu_prim_POSCAR")
+        cls.cu_defect_gen_string = (
             "DefectsGenerator for input composition Cu, space group Fm-3m with 9 defect entries created."
         )
-        self.cu_defect_gen_info = (
+        cls.cu_defect_gen_info = (
             """Vacancies    Guessed Charges    Conv. Cell Coords    Wyckoff
 -----------  -----------------  -------------------  ---------
 v_Cu         [+1,0,-1]          [0.000,0.000,0.000]  4a
@@ -292,11 +322,11 @@ Cu_i_Td          [+2,+1,0]          [0.250,0.250,0.250]  8c
         atoms = make_supercell(atoms, [[2, 0, 0], [0, 2, 0], [0, 0, 2]])
         atoms.set_chemical_symbols(["Cu", "Ag"] * 4)
         aaa = AseAtomsAdaptor()
-        self.agcu = aaa.get_structure(atoms)
-        self.agcu_defect_gen_string = (
+        cls.agcu = aaa.get_structure(atoms)
+        cls.agcu_defect_gen_string = (
             "DefectsGenerator for input composition AgCu, space group R-3m with 28 defect entries created."
         )
-        self.agcu_defect_gen_info = (
+        cls.agcu_defect_gen_info = (
             """Vacancies    Guessed Charges    Conv. Cell Coords    Wyckoff
 -----------  -----------------  -------------------  ---------
 v_Cu         [+1,0,-1]          [0.000,0.000,0.000]  3a
@@ -322,7 +352,7 @@ Ag_i_C3v_Cu1.80               [+1,0]             [0.000,0.000,0.250]  6c
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.cd_i_CdTe_supercell_defect_gen_info = (
+        cls.cd_i_CdTe_supercell_defect_gen_info = (
             """Vacancies                     Guessed Charges    Conv. Cell Coords    Wyckoff
 ----------------------------  -----------------  -------------------  ---------
 v_Cd_C1                       [+1,0,-1]          [0.333,0.333,0.333]  18c
@@ -470,9 +500,9 @@ Te_i_Cs_Te2.83Cd3.27Te5.42e   [+4,+3,+2,+1,0,-1,-2]  [0.556,0.111,0.278]  9b
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.N_doped_diamond_supercell = Structure.from_file(f"{self.data_dir}/N_C_diamond_POSCAR")
+        cls.N_doped_diamond_supercell = Structure.from_file(f"{cls.data_dir}/N_C_diamond_POSCAR")
 
-        self.N_diamond_defect_gen_info = (
+        cls.N_diamond_defect_gen_info = (
             """Vacancies                 Guessed Charges    Conv. Cell Coords    Wyckoff
 ------------------------  -----------------  -------------------  ---------
 v_C_C1_C1.54C2.52C2.95a   [+1,0,-1]          [0.167,0.167,0.028]  18c
@@ -597,12 +627,12 @@ N_C_Cs_C1.54N1.54         [+1,0,-1]          [0.055,0.111,0.333]  9b
             "standard structure, for which doped uses the spglib convention."
         )
 
-        self.zn3p2 = Structure.from_file(f"{self.data_dir}/Zn3P2_POSCAR")
-        self.sb2se3 = Structure.from_file(f"{self.data_dir}/Sb2Se3_bulk_supercell_POSCAR")
-        self.ag2se = Structure.from_file(f"{self.data_dir}/Ag2Se_POSCAR")
-        self.sb2si2te6 = Structure.from_file(f"{self.data_dir}/Sb2Si2Te6_POSCAR")
+        cls.zn3p2 = Structure.from_file(f"{cls.data_dir}/Zn3P2_POSCAR")
+        cls.sb2se3 = Structure.from_file(f"{cls.data_dir}/Sb2Se3_bulk_supercell_POSCAR")
+        cls.ag2se = Structure.from_file(f"{cls.data_dir}/Ag2Se_POSCAR")
+        cls.sb2si2te6 = Structure.from_file(f"{cls.data_dir}/Sb2Si2Te6_POSCAR")
 
-        self.sb2si2te6_defect_gen_info = (
+        cls.sb2si2te6_defect_gen_info = (
             """Vacancies    Guessed Charges     Conv. Cell Coords    Wyckoff
 -----------  ------------------  -------------------  ---------
 v_Si         [+1,0,-1,-2,-3,-4]  [0.000,0.000,0.445]  6c
@@ -643,11 +673,25 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
             "conventional standard structure, for which doped uses the spglib convention."
         )
 
-        self.sqs_agsbte2 = Structure.from_file(f"{self.data_dir}/AgSbTe2_SQS_POSCAR")
+        cls.sqs_agsbte2 = Structure.from_file(f"{cls.data_dir}/AgSbTe2_SQS_POSCAR")
+
+        cls.liga5o8 = Structure.from_file(f"{cls.data_dir}/LiGa5O8_CONTCAR")
+
+        cls.conv_si = Structure.from_file(f"{cls.data_dir}/Si_MP_conv_POSCAR")
+
+        cls._CdTe_defect_gen_and_output = None  # generated on first use, see _get_CdTe_defect_gen()
 
-        self.liga5o8 = Structure.from_file(f"{self.data_dir}/LiGa5O8_CONTCAR")
+    def setUp(self):
+        # run each test in its own temporary directory, so that the json files written to the current
+        # directory (e.g. the default ``{formula}_defects_generator.json``) don't clash between tests
+        # run in parallel (e.g. with ``pytest-xdist``):
+        self._orig_cwd = os.getcwd()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp_dir.name)
 
-        self.conv_si = Structure.from_file(f"{self.data_dir}/Si_MP_conv_POSCAR")
+    def tearDown(self):
+        os.chdir(self._orig_cwd)
+        self._tmp_dir.cleanup()
 
     def _save_defect_gen_jsons(self, defect_gen):
         defect_gen.to_json("test.json")
@@ -689,7 +733,7 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
         if_present_rm(default_json_filename)
 
     def _general_defect_gen_check(self, defect_gen, charge_states_removed=False):
-        assert self.structure_matcher.fit(
+        assert self.supercell_structure_matcher.fit(
             defect_gen.primitive_structure * defect_gen.supercell_matrix,
             defect_gen.bulk_supercell,
         )
@@ -716,16 +760,14 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
 
         assert np.isclose(defect_gen.min_image_distance, get_min_image_distance(defect_gen.bulk_supercell))
 
-        assert all(defect.defect_type == DefectType.Vacancy for defect in defect_gen.defects["vacancies"])
-        if "substitutions" in defect_gen.defects:
-            assert all(
-                defect.defect_type == DefectType.Substitution
-                for defect in defect_gen.defects["substitutions"]
-            )
-        assert all(
-            defect.defect_type == DefectType.Interstitial
-            for defect in defect_gen.defects.get("interstitials", [])
-        )
+        assert {defect.defect_type for defect in defect_gen.defects["vacancies"]} == {DefectType.Vacancy}
+        for defect_type_name, defect_type in [
+            ("substitutions", DefectType.Substitution),
+            ("interstitials", DefectType.Interstitial),
+        ]:  # may not be present
+            assert {defect.defect_type for defect in defect_gen.defects.get(defect_type_name, [])} <= {
+                defect_type
+            }
         assert sum(vacancy.multiplicity for vacancy in defect_gen.defects["vacancies"]) == len(
             defect_gen.primitive_structure
         )
@@ -755,16 +797,41 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
                             set(Poscar(structure).site_symbols)
                         )  # no duplicates
 
+        # reference lattice matrices, which are the same for all defect entries:
+        conventional_structure = _get_conventional_standard_structure(
+            IStructure.from_sites(defect_gen.structure)
+        )
+        ref_lattice_matrices = {
+            "bulk_supercell": defect_gen.bulk_supercell.lattice.matrix,
+            "conventional_structure": swap_axes(
+                conventional_structure, defect_gen._BilbaoCS_conv_cell_vector_mapping
+            ).lattice.matrix,
+        }
+        # charge states match the name suffixes and sc_entry lattices match the bulk supercell, checked
+        # for all entries at once:
+        assert {name: entry.charge_state for name, entry in defect_gen.defect_entries.items()} == {
+            name: int(name.rsplit("_", 1)[1]) for name in defect_gen.defect_entries
+        }
+        sc_entry_lattice_matrices = np.stack(
+            [entry.sc_entry.structure.lattice.matrix for entry in defect_gen.defect_entries.values()]
+        )
+        np.testing.assert_allclose(
+            sc_entry_lattice_matrices,
+            np.broadcast_to(ref_lattice_matrices["bulk_supercell"], sc_entry_lattice_matrices.shape),
+        )
         for defect_name, defect_entry in defect_gen.defect_entries.items():
-            self._check_defect_entry(defect_entry, defect_name, defect_gen, charge_states_removed)
+            self._check_defect_entry(
+                defect_entry, defect_name, defect_gen, ref_lattice_matrices, charge_states_removed
+            )
 
         random_name, random_defect_entry = random.choice(list(defect_gen.defect_entries.items()))
         self._random_equiv_supercell_sites_check(random_defect_entry)
         self._check_editing_defect_gen(random_name, defect_gen)
 
-    def _check_defect_entry(self, defect_entry, defect_name, defect_gen, charge_states_removed=False):
+    def _check_defect_entry(
+        self, defect_entry, defect_name, defect_gen, ref_lattice_matrices, charge_states_removed=False
+    ):
         assert defect_entry.name == defect_name
-        assert defect_entry.charge_state == int(defect_name.split("_")[-1])
         assert defect_entry.wyckoff
         assert defect_entry.defect
         assert defect_entry.defect.wyckoff == defect_entry.wyckoff
@@ -775,21 +842,13 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
         assert np.isclose(
             defect_entry.defect.conv_cell_frac_coords, defect_entry.conv_cell_frac_coords
         ).all()
-        np.testing.assert_allclose(
-            defect_entry.sc_entry.structure.lattice.matrix,
-            defect_gen.bulk_supercell.lattice.matrix,
-        )
-        sga = SpacegroupAnalyzer(defect_gen.structure)
-        reoriented_conv_structure = swap_axes(
-            sga.get_conventional_standard_structure(), defect_gen._BilbaoCS_conv_cell_vector_mapping
-        )
-        assert np.allclose(
+        assert _matrices_close(
             defect_entry.conventional_structure.lattice.matrix,
-            reoriented_conv_structure.lattice.matrix,
+            ref_lattice_matrices["conventional_structure"],
         )
-        assert np.allclose(
+        assert _matrices_close(
             defect_entry.defect.conventional_structure.lattice.matrix,
-            reoriented_conv_structure.lattice.matrix,
+            ref_lattice_matrices["conventional_structure"],
         )
         # test no unwanted structure reordering
         for structure in [
@@ -802,36 +861,28 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
                 set(Poscar(structure).site_symbols)
             )  # no duplicates
 
-        # get minimum distance of defect_entry.conv_cell_frac_coords to any site in
-        # defect_entry.conventional_structure
+        # get minimum distance of defect_entry.conv_cell_frac_coords (and its equivalent coords) to
+        # any site in defect_entry.conventional_structure, for all coords at once:
+        conv_cell_frac_coords = np.vstack(
+            [defect_entry.conv_cell_frac_coords, *defect_entry.equiv_conv_cell_frac_coords]
+        )
         distance_matrix = np.linalg.norm(
             np.dot(
                 pbc_diff(
-                    np.array([site.frac_coords for site in defect_entry.conventional_structure]),
-                    defect_entry.conv_cell_frac_coords,
+                    defect_entry.conventional_structure.frac_coords[:, np.newaxis, :],
+                    conv_cell_frac_coords[np.newaxis, :, :],
                 ),
                 defect_entry.conventional_structure.lattice.matrix,
             ),
-            axis=1,
-        )
-        min_dist = min(distance_matrix[distance_matrix > 0.01])
+            axis=-1,
+        )  # shape: (num sites, num coords)
+        min_dists = np.where(distance_matrix > 0.01, distance_matrix, np.inf).min(axis=0)
+        min_dist = min_dists[0]
         if defect_gen.interstitial_gen_kwargs is not False:
             assert min_dist > defect_gen.interstitial_gen_kwargs.get(
                 "min_dist", 0.9
             )  # default min_dist = 0.9
-        for conv_cell_frac_coords in defect_entry.equiv_conv_cell_frac_coords:
-            distance_matrix = np.linalg.norm(
-                np.dot(
-                    pbc_diff(
-                        np.array([site.frac_coords for site in defect_entry.conventional_structure]),
-                        conv_cell_frac_coords,
-                    ),
-                    defect_entry.conventional_structure.lattice.matrix,
-                ),
-                axis=1,
-            )
-            equiv_min_dist = min(distance_matrix[distance_matrix > 0.01])
-            assert np.isclose(min_dist, equiv_min_dist, atol=0.01)
+        assert np.allclose(min_dists[1:], min_dist, atol=0.01)  # same for equivalent coords
 
         # test equivalent_sites for defects:
         assert len(defect_entry.defect.equivalent_sites) == defect_entry.defect.multiplicity
@@ -841,14 +892,14 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
                 equiv_site.coords,
                 5,
             )
-            nn_distances = np.array([nn.distance_from_point(equiv_site.coords) for nn in nearest_atoms])
-            nn_distance = min(nn_distances[nn_distances > 0.01])  # minimum nonzero distance
+            nn_distances = np.array([nn.nn_distance for nn in nearest_atoms])
+            nn_distance = nn_distances[nn_distances > 0.01].min()  # minimum nonzero distance
             print(defect_entry.name, equiv_site.coords, nn_distance, min_dist)
             assert np.isclose(min_dist, nn_distance, atol=0.01)  # same min_dist as from
             # conv_cell_frac_coords testing above
 
-        assert np.allclose(
-            defect_entry.bulk_supercell.lattice.matrix, defect_gen.bulk_supercell.lattice.matrix
+        assert _matrices_close(
+            defect_entry.bulk_supercell.lattice.matrix, ref_lattice_matrices["bulk_supercell"]
         )
         num_prim_cells_in_conv_cell = len(defect_entry.conventional_structure) / len(
             defect_entry.defect.structure
@@ -887,6 +938,13 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
 
         # test charge state guessing:
         if not charge_states_removed:
+            # charge states of generated entries for this defect, parsed once from the entry names:
+            defect_name_wout_charge = defect_entry.name.rsplit("_", 1)[0]
+            generated_charge_states = {
+                int(name.rsplit("_", 1)[1])
+                for name in defect_gen.defect_entries
+                if name.startswith(defect_name_wout_charge)
+            }
             for charge_state_dict in defect_entry.charge_state_guessing_log:
                 charge_state = charge_state_dict["input_parameters"]["charge_state"]
                 try:
@@ -899,28 +957,13 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
                         raise e
 
                 if charge_state_dict["probability"] > charge_state_dict["probability_threshold"]:
-                    assert any(
-                        defect_name in defect_gen.defect_entries
-                        for defect_name in defect_gen.defect_entries
-                        if int(defect_name.split("_")[-1]) == charge_state
-                        and defect_name.startswith(defect_entry.name.rsplit("_", 1)[0])
-                    )
+                    assert charge_state in generated_charge_states
                 else:
                     try:
-                        assert all(
-                            defect_name not in defect_gen.defect_entries
-                            for defect_name in defect_gen.defect_entries
-                            if int(defect_name.split("_")[-1]) == charge_state
-                            and defect_name.startswith(defect_entry.name.rsplit("_", 1)[0])
-                        )
+                        assert charge_state not in generated_charge_states
                     except AssertionError as e:
                         # check if intermediate charge state:
-                        if all(
-                            defect_name not in defect_gen.defect_entries
-                            for defect_name in defect_gen.defect_entries
-                            if abs(int(defect_name.split("_")[-1])) > abs(charge_state)
-                            and defect_name.startswith(defect_entry.name.rsplit("_", 1)[0])
-                        ):
+                        if all(abs(q) <= abs(charge_state) for q in generated_charge_states):
                             raise e
 
         # check __repr__ info:
@@ -940,21 +983,26 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
         # get minimum distance of defect_entry.defect_supercell_site to any site in
         # defect_entry.bulk_supercell:
         distance_matrix = defect_entry.defect_supercell.distance_matrix
-        min_dist = min(distance_matrix[distance_matrix > 0.01])
+        min_dist = distance_matrix[distance_matrix > 0.01].min()
         print(min_dist)
 
-        min_dist_in_bulk = min(  # account for rare case where defect introduction _increases_ the
-            # minimum atomic distance (e.g. vacancy in defect supercell that had an interstitial)
-            defect_entry.bulk_supercell.distance_matrix[defect_entry.bulk_supercell.distance_matrix > 0.01]
-        )
+        bulk_supercell = defect_entry.bulk_supercell
+        bulk_distance_matrix = bulk_supercell.distance_matrix
+        # account for rare case where defect introduction _increases_ the minimum atomic distance
+        # (e.g. vacancy in defect supercell that had an interstitial):
+        min_dist_in_bulk = bulk_distance_matrix[bulk_distance_matrix > 0.01].min()
 
-        for equiv_defect_supercell_site in defect_entry.equivalent_supercell_sites:
-            new_defect_structure = defect_entry.bulk_supercell.copy()
-            new_defect_structure.append(
-                equiv_defect_supercell_site.specie, equiv_defect_supercell_site.frac_coords
-            )
-            distance_matrix = new_defect_structure.distance_matrix
-            equiv_min_dist = min(distance_matrix[distance_matrix > 0.01])
+        # adding an equivalent site to the bulk supercell only adds the distances from that site, so get
+        # these for all equivalent sites at once, rather than the full distance matrix for each:
+        equiv_site_distances = bulk_supercell.lattice.get_all_distances(
+            [site.frac_coords for site in defect_entry.equivalent_supercell_sites],
+            bulk_supercell.frac_coords,
+        )
+        equiv_min_dists = np.minimum(
+            np.where(equiv_site_distances > 0.01, equiv_site_distances, np.inf).min(axis=1),
+            min_dist_in_bulk,
+        )
+        for equiv_min_dist in equiv_min_dists:
             print(equiv_min_dist)
             assert np.isclose(min_dist, equiv_min_dist, atol=0.01) or np.isclose(
                 min_dist_in_bulk, equiv_min_dist, atol=0.01
@@ -992,10 +1040,7 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
             assert "Value must have the same supercell as the DefectsGenerator object," in str(e.exception)
 
     def _generate_and_test_no_warnings(self, structure, min_image_distance=None, **kwargs):
-        original_stdout = sys.stdout  # Save a reference to the original standard output
-        sys.stdout = StringIO()  # Redirect standard output to a stringIO object.
-        w = None
-        try:
+        with contextlib.redirect_stdout(StringIO()) as stdout:  # capture printed output
             with warnings.catch_warnings(record=True) as w:
                 warnings.resetwarnings()
                 defect_gen = DefectsGenerator(structure, **kwargs)
@@ -1012,15 +1057,26 @@ Te_i_C3i_Te2.81  [+4,+3,+2,+1,0,-1,-2]        [0.000,0.000,0.000]  3a
                     f"calculations, but generate_supercell = False, so using input structure as "
                     f"defect & bulk supercells. Caution advised!" in str(w[-1].message)
                 )
-            output = sys.stdout.getvalue()  # Return a str containing the printed output
-        finally:
-            sys.stdout = original_stdout  # Reset standard output to its original value.
+            output = stdout.getvalue()
 
         if w:
             print([str(warning.message) for warning in w])  # for debugging
 
         return defect_gen, output
 
+    def _get_CdTe_defect_gen(self):
+        """
+        Get a copy of the ``DefectsGenerator`` for primitive CdTe with default
+        settings, and its printed output, which is only generated (and checked
+        for warnings) once for the test class.
+        """
+        cls = type(self)
+        if cls._CdTe_defect_gen_and_output is None:
+            cls._CdTe_defect_gen_and_output = self._generate_and_test_no_warnings(self.prim_cdte)
+
+        CdTe_defect_gen, output = cls._CdTe_defect_gen_and_output
+        return copy.deepcopy(CdTe_defect_gen), output
+
     def test_extrinsic(self):
         def _split_and_check_orig_CdTe_output(output):
             # split self.CdTe_defect_gen_info into lines and check each line is in the output:
@@ -1604,7 +1660,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         assert CdTe_defect_gen.interstitial_gen_kwargs == {"min_dist": 0.01}  # check attribute set
 
     def test_target_frac_coords(self):
-        defect_gen = DefectsGenerator(self.prim_cdte)
+        defect_gen, _output = self._get_CdTe_defect_gen()
         target_frac_coords1 = [0, 0, 0]
         target_frac_coords2 = [0.15, 0.8, 0.777]
         target_frac1_defect_gen = DefectsGenerator(self.prim_cdte, target_frac_coords=target_frac_coords1)
@@ -1709,6 +1765,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
 
     def CdTe_defect_gen_check(self, CdTe_defect_gen, generate_supercell=True):
         self._general_defect_gen_check(CdTe_defect_gen)
+        v_Cd_site = PeriodicSite("Cd", [0, 0, 0], CdTe_defect_gen.primitive_structure.lattice)  # reused
 
         # test attributes:
         assert self.CdTe_defect_gen_info in CdTe_defect_gen._defect_generator_info()
@@ -1749,12 +1806,8 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         assert CdTe_defect_gen.defects["vacancies"][0].name == "v_Cd"
         assert CdTe_defect_gen.defects["vacancies"][0].oxi_state == -2
         assert CdTe_defect_gen.defects["vacancies"][0].multiplicity == 1
-        assert CdTe_defect_gen.defects["vacancies"][0].defect_site == PeriodicSite(
-            "Cd", [0, 0, 0], CdTe_defect_gen.primitive_structure.lattice
-        )
-        assert CdTe_defect_gen.defects["vacancies"][0].site == PeriodicSite(
-            "Cd", [0, 0, 0], CdTe_defect_gen.primitive_structure.lattice
-        )
+        assert CdTe_defect_gen.defects["vacancies"][0].defect_site == v_Cd_site
+        assert CdTe_defect_gen.defects["vacancies"][0].site == v_Cd_site
         assert (
             len(CdTe_defect_gen.defects["vacancies"][0].equiv_conv_cell_frac_coords) == 4
         )  # 4x conv cell
@@ -1948,12 +2001,8 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.multiplicity == 1
         assert CdTe_defect_gen.defect_entries["v_Cd_0"].wyckoff == "4a"
         assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.defect_type == DefectType.Vacancy
-        assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.defect_site == PeriodicSite(
-            "Cd", [0, 0, 0], CdTe_defect_gen.primitive_structure.lattice
-        )
-        assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.site == PeriodicSite(
-            "Cd", [0, 0, 0], CdTe_defect_gen.primitive_structure.lattice
-        )
+        assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.defect_site == v_Cd_site
+        assert CdTe_defect_gen.defect_entries["v_Cd_0"].defect.site == v_Cd_site
         np.testing.assert_allclose(
             CdTe_defect_gen.defect_entries["v_Cd_0"].conv_cell_frac_coords,
             np.array([0, 0, 0]),
@@ -1971,19 +2020,25 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
                 atol=1e-3,
             )
 
-    def test_defects_generator_cdte(self):
-        CdTe_defect_gen, output = self._generate_and_test_no_warnings(self.prim_cdte)
-
+    def _CdTe_input_structure_check(self, CdTe_defect_gen, output, input_structure):
+        """
+        Shared checks for CdTe ``DefectsGenerator`` outputs, which should be
+        the same regardless of the input (primitive or supercell) structure.
+        """
         assert self.CdTe_defect_gen_info in output  # matches expected 4b & 4d Wyckoff letters for Td
         # interstitials (https://doi.org/10.1016/j.solener.2013.12.017)
 
-        assert CdTe_defect_gen.structure == self.prim_cdte
+        assert CdTe_defect_gen.structure == input_structure
 
         # defect_gen_check changes defect_entries ordering, so save to json first:
         self._save_defect_gen_jsons(CdTe_defect_gen)
         self.CdTe_defect_gen_check(CdTe_defect_gen)
         self._load_and_test_defect_gen_jsons(CdTe_defect_gen)
 
+    def test_defects_generator_cdte(self):
+        CdTe_defect_gen, output = self._get_CdTe_defect_gen()
+        self._CdTe_input_structure_check(CdTe_defect_gen, output, self.prim_cdte)
+
         CdTe_defect_gen.to_json(f"{self.data_dir}/CdTe_defect_gen.json")  # for testing in test_vasp.py
 
         # test get_defect_name_from_entry relaxed/unrelaxed warnings:
@@ -2011,16 +2066,10 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
 
     def test_defects_generator_CdTe_supercell_input(self):
         CdTe_defect_gen, output = self._generate_and_test_no_warnings(self.CdTe_bulk_supercell)
-
-        assert self.CdTe_defect_gen_info in output
-        assert CdTe_defect_gen.structure == self.CdTe_bulk_supercell
-
-        self._save_defect_gen_jsons(CdTe_defect_gen)
-        self.CdTe_defect_gen_check(CdTe_defect_gen)
-        self._load_and_test_defect_gen_jsons(CdTe_defect_gen)
+        self._CdTe_input_structure_check(CdTe_defect_gen, output, self.CdTe_bulk_supercell)
 
     def test_adding_charge_states(self):
-        CdTe_defect_gen, _output = self._generate_and_test_no_warnings(self.prim_cdte)
+        CdTe_defect_gen, _output = self._get_CdTe_defect_gen()
 
         CdTe_defect_gen.add_charge_states("Cd_i_C3v_0", [-7, -6])
         self._general_defect_gen_check(CdTe_defect_gen)
@@ -2031,7 +2080,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         assert info_line in repr(CdTe_defect_gen)
 
     def test_removing_charge_states(self):
-        CdTe_defect_gen, _output = self._generate_and_test_no_warnings(self.prim_cdte)
+        CdTe_defect_gen, _output = self._get_CdTe_defect_gen()
         CdTe_defect_gen.remove_charge_states("Cd_i", [+1, +2])
         self._general_defect_gen_check(CdTe_defect_gen, charge_states_removed=True)
 
@@ -2046,7 +2095,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         assert info_line in repr(CdTe_defect_gen)
 
         # check removing neutral charge state still fine:
-        CdTe_defect_gen, _output = self._generate_and_test_no_warnings(self.prim_cdte)
+        CdTe_defect_gen, _output = self._get_CdTe_defect_gen()
         CdTe_defect_gen.remove_charge_states("Cd_i", [0, +1])
         self._general_defect_gen_check(CdTe_defect_gen, charge_states_removed=True)
 
@@ -2901,7 +2950,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
             return
 
         # test inputting a defective supercell
-        CdTe_defect_gen = DefectsGenerator(self.prim_cdte)
+        CdTe_defect_gen, _output = self._get_CdTe_defect_gen()
 
         cd_i_defect_gen, output = self._generate_and_test_no_warnings(
             CdTe_defect_gen["Cd_i_C3v_0"].sc_entry.structure,
@@ -2929,9 +2978,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
         if not _potcars_available():
             return
 
-        original_stdout = sys.stdout  # Save a reference to the original standard output
-        sys.stdout = StringIO()  # Redirect standard output to a stringIO object.
-        try:
+        with contextlib.redirect_stdout(StringIO()) as stdout:  # capture printed output
             with warnings.catch_warnings(record=True) as w:
                 warnings.resetwarnings()
                 N_diamond_defect_gen = DefectsGenerator(
@@ -2949,10 +2996,7 @@ Se_i_Td          [0,-1,-2]              [0.500,0.500,0.500]  4b"""
                 )
                 assert N_diamond_defect_gen.interstitial_gen_kwargs is False  # check attribute set
 
-                output = sys.stdout.getvalue()  # Return a str containing the printed output
-
-        finally:
-            sys.stdout = original_stdout  # Reset standard output to its original value.
+                output = stdout.getvalue()
 
         assert self.N_diamond_defect_gen_info in output
         assert "_i_" not in output  # no interstitials generated
@@ -9,6 +9,7 @@ import os
 import random
 import unittest
 import warnings
+from functools import lru_cache
 from threading import Thread
 
 import numpy as np
@@ -35,6 +36,7 @@ from doped.vasp import (
 )
 
 
+@lru_cache(maxsize=None)  # static property of the test environment, so only check once
 def _potcars_available() -> bool:
     """
     Check if the POTCARs are available for the tests (i.e. testing locally).
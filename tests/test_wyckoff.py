@@ -22,10 +22,17 @@ class WyckoffTest(unittest.TestCase):
 
     def test_wyckoff_dict_from_sgn(self):
         for sgn in range(1, 231):
-            wyckoff_dict = get_wyckoff_dict_from_sgn(sgn)
-            assert isinstance(wyckoff_dict, dict)
-            assert all(isinstance(k, str) for k in wyckoff_dict)
-            assert all(isinstance(v, list) for v in wyckoff_dict.values())
+            with self.subTest(sgn=sgn):
+                wyckoff_dict = get_wyckoff_dict_from_sgn(sgn)
+                assert isinstance(wyckoff_dict, dict)
+                assert all(isinstance(k, str) for k in wyckoff_dict)
+                assert all(isinstance(v, list) for v in wyckoff_dict.values())
+
+        # cached, but returns a new copy each time:
+        wyckoff_dict = get_wyckoff_dict_from_sgn(216)
+        wyckoff_dict["4a"].clear()
+        assert get_wyckoff_dict_from_sgn(216)["4a"]
+        assert get_wyckoff_dict_from_sgn(216) is not get_wyckoff_dict_from_sgn(216)
 
     def test_wyckoff_label_and_equiv_coord_list(self):
         """